@@ -5,13 +5,27 @@ A Python SDK for instrumenting MCP (Model Context Protocol) servers with
 OpenTelemetry-based observability tracking.
 """
 
-from hmdl.client import HeimdallClient
-from hmdl.decorators import trace_mcp_tool, UserExtractor, SessionExtractor
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from hmdl.config import HeimdallConfig
 from hmdl.types import SpanKind, SpanStatus
 
+if TYPE_CHECKING:
+    from hmdl.client import HeimdallClient
+    from hmdl.decorators import trace_mcp_tool, UserExtractor, SessionExtractor
+
 __version__ = "0.0.1"
 
+# Names resolved on first access so that ``import hmdl`` does not load the
+# OpenTelemetry SDK and exporters until the client or decorators are used.
+_LAZY_IMPORTS = {
+    "HeimdallClient": "hmdl.client",
+    "trace_mcp_tool": "hmdl.decorators",
+    "UserExtractor": "hmdl.decorators",
+    "SessionExtractor": "hmdl.decorators",
+}
+
 __all__ = [
     # Client
     "HeimdallClient",
@@ -28,3 +42,18 @@ __all__ = [
     "__version__",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the client and decorator exports on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in ``dir(hmdl)``."""
+    return sorted(set(globals()) | set(__all__))
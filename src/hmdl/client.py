@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import atexit
+import itertools
 import logging
-from typing import Optional, Dict, Any
+import threading
+from contextvars import ContextVar
+from typing import Optional, Dict, Any, Tuple
 
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBased, Sampler, TraceIdRatioBased
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
 from opentelemetry.sdk.resources import Resource, SERVICE_NAME
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 
@@ -17,6 +21,19 @@ from hmdl.types import HeimdallAttributes
 
 logger = logging.getLogger(__name__)
 
+# Session and user IDs set from the current thread or asyncio task, stored with
+# the generation of the client that set them. Values from a reset client are
+# ignored, and the context never holds a reference to a discarded client.
+_session_id_var: ContextVar[Tuple[int, Optional[str]]] = ContextVar(
+    "heimdall_session_id", default=(0, None)
+)
+_user_id_var: ContextVar[Tuple[int, Optional[str]]] = ContextVar(
+    "heimdall_user_id", default=(0, None)
+)
+
+# Generations handed to each initialized client; 0 is never used
+_generations = itertools.count(1)
+
 
 class HeimdallClient:
     """Client for sending observability data to Heimdall platform.
@@ -37,13 +54,33 @@ class HeimdallClient:
     """
 
     _instance: Optional["HeimdallClient"] = None
+    # Instance under construction; published as _instance once __init__ finishes
+    _pending: Optional["HeimdallClient"] = None
     _initialized: bool = False
 
+    # Defaults for state read by the decorators' fast path, so a client seen
+    # before __init__ has finished behaves as disabled
+    _tracer: Optional[trace.Tracer] = None
+    _provider: Optional[TracerProvider] = None
+    _session_id: Optional[str] = None
+    _user_id: Optional[str] = None
+    _generation: int = 0
+    # Only taken while the singleton is first built; later calls never lock
+    _lock = threading.Lock()
+
     def __new__(cls, *args: Any, **kwargs: Any) -> "HeimdallClient":
         """Singleton pattern to ensure only one client instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        with cls._lock:
+            if cls._instance is not None:
+                return cls._instance
+            # Concurrent constructors share the pending instance; its __init__
+            # waits on the lock and returns once the first one has finished
+            if cls._pending is None:
+                cls._pending = super().__new__(cls)
+            return cls._pending
 
     def __init__(
         self,
@@ -69,45 +106,63 @@ class HeimdallClient:
             project_id: Project ID from Heimdall dashboard.
             session_id: Session ID for tracking MCP client sessions.
             user_id: User ID for tracking users.
+
+        Only the first construction initializes the client; later calls return
+        the existing instance before any configuration is read.
         """
         if self._initialized:
             return
-
-        # Build config from arguments or use provided config
-        if config is not None:
-            self.config = config
-        else:
-            self.config = HeimdallConfig(
-                api_key=api_key or HeimdallConfig().api_key,
-                endpoint=endpoint or HeimdallConfig().endpoint,
-                service_name=service_name or HeimdallConfig().service_name,
-                environment=environment or HeimdallConfig().environment,
-                org_id=org_id or HeimdallConfig().org_id,
-                project_id=project_id or HeimdallConfig().project_id,
-                session_id=session_id or HeimdallConfig().session_id,
-                user_id=user_id or HeimdallConfig().user_id,
-            )
-
-        self._tracer: Optional[trace.Tracer] = None
-        self._provider: Optional[TracerProvider] = None
-
-        # Runtime session and user tracking (can be updated dynamically)
-        self._session_id: Optional[str] = self.config.session_id
-        self._user_id: Optional[str] = self.config.user_id
-
-        if self.config.enabled:
-            self._setup_tracing()
-
-        self._initialized = True
-
-        # Register cleanup on exit
-        atexit.register(self.shutdown)
+        with self._lock:
+            # Another thread may have finished initializing while we waited
+            if self._initialized:
+                return
+            # Build config from arguments or use provided config
+            if config is not None:
+                self.config = config
+            else:
+                # Only pass explicitly provided values; everything else falls back to
+                # the environment defaults of a single HeimdallConfig instance.
+                overrides: Dict[str, Any] = {
+                    key: value
+                    for key, value in (
+                        ("api_key", api_key),
+                        ("endpoint", endpoint),
+                        ("service_name", service_name),
+                        ("environment", environment),
+                        ("org_id", org_id),
+                        ("project_id", project_id),
+                        ("session_id", session_id),
+                        ("user_id", user_id),
+                    )
+                    if value
+                }
+                self.config = HeimdallConfig(**overrides)
+
+            self._tracer = None
+            self._provider = None
+
+            # Process-wide session and user IDs, used wherever the current
+            # context has not set its own
+            self._session_id = self.config.session_id
+            self._user_id = self.config.user_id
+            self._generation = next(_generations)
+
+            if self.config.enabled:
+                self._setup_tracing()
+
+            self._initialized = True
+            # Publish only now, so traced calls never see a half-built client
+            type(self)._instance = self
+            type(self)._pending = None
+
+            # Register cleanup on exit
+            atexit.register(self.shutdown)
     
     def _setup_tracing(self) -> None:
         """Set up OpenTelemetry tracing."""
         if self.config.debug:
-            logging.basicConfig(level=logging.DEBUG)
-            logger.setLevel(logging.DEBUG)
+            # Only raise the SDK's own log level; handlers are left to the application
+            logging.getLogger("hmdl").setLevel(logging.DEBUG)
         
         # Create resource with service information
         resource = Resource.create({
@@ -117,21 +172,15 @@ class HeimdallClient:
             HeimdallAttributes.HEIMDALL_PROJECT_ID: self.config.project_id,
         })
         
+        # Sample a fraction of new traces; keep the SDK default when recording everything
+        sampler: Optional[Sampler] = None
+        if self.config.sample_rate < 1.0:
+            sampler = ParentBased(TraceIdRatioBased(self.config.sample_rate))
+
         # Create tracer provider
-        self._provider = TracerProvider(resource=resource)
+        self._provider = TracerProvider(resource=resource, sampler=sampler)
         
-        # Set up OTLP HTTP exporter
-        otlp_endpoint = f"{self.config.endpoint}/v1/traces"
-
-        # Only add auth header if API key is provided
-        headers = {}
-        if self.config.api_key:
-            headers["Authorization"] = f"Bearer {self.config.api_key}"
-
-        exporter = OTLPSpanExporter(
-            endpoint=otlp_endpoint,
-            headers=headers if headers else None,
-        )
+        exporter = self._create_exporter()
         
         # Add batch processor for efficient span export
         processor = BatchSpanProcessor(
@@ -139,6 +188,7 @@ class HeimdallClient:
             max_queue_size=self.config.max_queue_size,
             max_export_batch_size=self.config.batch_size,
             schedule_delay_millis=self.config.flush_interval_ms,
+            export_timeout_millis=self.config.export_timeout_ms,
         )
         self._provider.add_span_processor(processor)
         
@@ -150,6 +200,30 @@ class HeimdallClient:
         
         logger.debug(f"Heimdall tracing initialized for service: {self.config.service_name}")
 
+    def _create_exporter(self) -> SpanExporter:
+        """Create the OTLP span exporter for the configured protocol."""
+        timeout = self.config.export_timeout_ms / 1000
+        headers = dict(self.config.export_headers) or None
+
+        if self.config.protocol == "grpc":
+            # Imported lazily so the gRPC stack is only loaded when it is used
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+                OTLPSpanExporter as GrpcSpanExporter,
+            )
+
+            return GrpcSpanExporter(
+                endpoint=self.config.export_endpoint,
+                headers=headers,
+                timeout=timeout,
+            )
+
+        # OTLP over HTTP/protobuf; the exporter reuses one keep-alive session
+        return OTLPSpanExporter(
+            endpoint=self.config.traces_endpoint,
+            headers=headers,
+            timeout=timeout,
+        )
+
     @property
     def tracer(self) -> trace.Tracer:
         """Get the OpenTelemetry tracer."""
@@ -196,14 +270,25 @@ class HeimdallClient:
             logger.debug("Heimdall client shutdown complete")
 
     def get_session_id(self) -> Optional[str]:
-        """Get the current session ID."""
+        """Get the current session ID.
+
+        Returns the value set in the current thread or asyncio task, falling
+        back to the last value set anywhere in the process (initially the
+        configured ``session_id``).
+        """
+        generation, session_id = _session_id_var.get()
+        if generation == self._generation:
+            return session_id
         return self._session_id
 
     def set_session_id(self, session_id: Optional[str]) -> None:
-        """Set the session ID for all subsequent spans.
+        """Set the session ID for subsequent spans.
 
         Call this when an MCP client connects to associate all operations
-        with that session.
+        with that session. The value takes precedence in the current thread or
+        asyncio task (and tasks it starts), so concurrent requests that each
+        set an ID keep their own. It also becomes the process-wide default for
+        threads and tasks that have not set one.
 
         Args:
             session_id: The session identifier (e.g., from MCP client connection)
@@ -213,16 +298,27 @@ class HeimdallClient:
             >>> client.set_session_id(ctx.session_id or ctx.client_info.name)
         """
         self._session_id = session_id
+        _session_id_var.set((self._generation, session_id))
         logger.debug(f"Session ID set to: {session_id}")
 
     def get_user_id(self) -> Optional[str]:
-        """Get the current user ID."""
+        """Get the current user ID.
+
+        Returns the value set in the current thread or asyncio task, falling
+        back to the last value set anywhere in the process (initially the
+        configured ``user_id``).
+        """
+        generation, user_id = _user_id_var.get()
+        if generation == self._generation:
+            return user_id
         return self._user_id
 
     def set_user_id(self, user_id: Optional[str]) -> None:
-        """Set the user ID for all subsequent spans.
+        """Set the user ID for subsequent spans.
 
         Can be overridden per-span using user_extractor option in decorators.
+        Like ``set_session_id``, the value takes precedence in the current
+        context and becomes the process-wide default elsewhere.
 
         Args:
             user_id: The user identifier
@@ -232,6 +328,7 @@ class HeimdallClient:
             >>> client.set_user_id("user-123")
         """
         self._user_id = user_id
+        _user_id_var.set((self._generation, user_id))
         logger.debug(f"User ID set to: {user_id}")
 
     @classmethod
@@ -242,8 +339,12 @@ class HeimdallClient:
     @classmethod
     def reset(cls) -> None:
         """Reset the singleton instance (mainly for testing)."""
-        if cls._instance is not None:
-            cls._instance.shutdown()
-        cls._instance = None
-        cls._initialized = False
+        with cls._lock:
+            if cls._instance is not None:
+                cls._instance.shutdown()
+                # Drop the exit hook so discarded clients are not kept alive by atexit
+                atexit.unregister(cls._instance.shutdown)
+            cls._instance = None
+            cls._pending = None
+            cls._initialized = False
 
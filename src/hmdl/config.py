@@ -4,16 +4,34 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Mapping, Any
 
+from hmdl.types import DATACLASS_SLOTS
 
-@dataclass
+# OTLP transports accepted by ``HeimdallConfig.protocol``
+SUPPORTED_PROTOCOLS = ("http/protobuf", "grpc")
+
+# Endpoints used when none is configured; OTLP listens on a different port per transport
+DEFAULT_HTTP_ENDPOINT = "http://localhost:4318"
+DEFAULT_GRPC_ENDPOINT = "http://localhost:4317"
+
+# Authorization scheme prefix for API keys
+BEARER_PREFIX = "Bearer "
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class HeimdallConfig:
     """Configuration for the Heimdall observability client.
 
+    Configurations are immutable; use ``dataclasses.replace`` to derive a
+    modified copy.
+
     Attributes:
         api_key: API key for authenticating with Heimdall platform.
-        endpoint: The Heimdall platform endpoint URL.
+        endpoint: The Heimdall platform endpoint URL. Empty means the default
+            for ``protocol``: ``http://localhost:4318`` for OTLP/HTTP and
+            ``http://localhost:4317`` for gRPC.
         service_name: Name of the service being instrumented.
         environment: Deployment environment (e.g., 'production', 'staging').
         org_id: Organization ID from Heimdall dashboard.
@@ -26,17 +44,33 @@ class HeimdallConfig:
         debug: Enable debug logging.
         batch_size: Number of spans to batch before sending.
         flush_interval_ms: Interval in milliseconds to flush spans.
-        max_queue_size: Maximum number of spans to queue.
+        max_queue_size: Maximum number of spans to queue. Spans are dropped
+            once the queue is full, so this should absorb traffic bursts.
+        export_timeout_ms: Timeout in milliseconds for a single span export.
+        protocol: OTLP transport, either 'http/protobuf' or 'grpc'.
+        sample_rate: Fraction of traces to record, between 0.0 and 1.0.
+            Sampling decisions of a parent span are respected.
+        capture_input: Record function arguments on spans. Disable to avoid
+            serializing large or sensitive inputs.
+        capture_output: Record function return values on spans.
+        max_attribute_length: Maximum length of recorded arguments and return
+            values; longer values are truncated to this length, marker
+            included. Defaults to 4096; 0 disables truncation.
+        record_exceptions: Add an exception event with the stack trace to
+            failed spans. The error type and message are always recorded.
         metadata: Additional metadata to attach to all spans.
+        export_endpoint: Endpoint spans are exported to; ``endpoint``, or the
+            default for ``protocol`` when it is empty.
+        traces_endpoint: OTLP/HTTP traces URL derived from ``export_endpoint``.
+        export_headers: Headers sent with every export, derived from ``api_key``.
     """
 
     api_key: Optional[str] = field(
         default_factory=lambda: os.environ.get("HEIMDALL_API_KEY")
     )
+    # Empty means the default endpoint for the configured protocol
     endpoint: str = field(
-        default_factory=lambda: os.environ.get(
-            "HEIMDALL_ENDPOINT", "http://localhost:4318"
-        )
+        default_factory=lambda: os.environ.get("HEIMDALL_ENDPOINT", "")
     )
     service_name: str = field(
         default_factory=lambda: os.environ.get("HEIMDALL_SERVICE_NAME", "mcp-server")
@@ -63,18 +97,83 @@ class HeimdallConfig:
         default_factory=lambda: os.environ.get("HEIMDALL_DEBUG", "false").lower() == "true"
     )
     batch_size: int = field(
-        default_factory=lambda: int(os.environ.get("HEIMDALL_BATCH_SIZE", "100"))
+        default_factory=lambda: int(os.environ.get("HEIMDALL_BATCH_SIZE", "256"))
     )
     flush_interval_ms: int = field(
         default_factory=lambda: int(os.environ.get("HEIMDALL_FLUSH_INTERVAL_MS", "5000"))
     )
     max_queue_size: int = field(
-        default_factory=lambda: int(os.environ.get("HEIMDALL_MAX_QUEUE_SIZE", "1000"))
+        default_factory=lambda: int(os.environ.get("HEIMDALL_MAX_QUEUE_SIZE", "4096"))
     )
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    
+    export_timeout_ms: int = field(
+        default_factory=lambda: int(os.environ.get("HEIMDALL_EXPORT_TIMEOUT_MS", "10000"))
+    )
+    protocol: str = field(
+        default_factory=lambda: os.environ.get("HEIMDALL_OTLP_PROTOCOL", "http/protobuf")
+    )
+    sample_rate: float = field(
+        default_factory=lambda: float(os.environ.get("HEIMDALL_SAMPLE_RATE", "1.0"))
+    )
+    capture_input: bool = field(
+        default_factory=lambda: os.environ.get("HEIMDALL_CAPTURE_INPUT", "true").lower() == "true"
+    )
+    capture_output: bool = field(
+        default_factory=lambda: os.environ.get("HEIMDALL_CAPTURE_OUTPUT", "true").lower() == "true"
+    )
+    max_attribute_length: int = field(
+        default_factory=lambda: int(os.environ.get("HEIMDALL_MAX_ATTRIBUTE_LENGTH", "4096"))
+    )
+    record_exceptions: bool = field(
+        default_factory=lambda: (
+            os.environ.get("HEIMDALL_RECORD_EXCEPTIONS", "true").lower() == "true"
+        )
+    )
+    # Mapping proxies are not hashable; metadata still takes part in equality
+    metadata: Mapping[str, Any] = field(
+        default_factory=lambda: MappingProxyType({}), hash=False
+    )
+
+    # Derived in __post_init__ so exporters can be (re)created without rebuilding them
+    export_endpoint: str = field(init=False, repr=False, compare=False)
+    traces_endpoint: str = field(init=False, repr=False, compare=False)
+    export_headers: Mapping[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Validate, freeze metadata and derive the export endpoint and headers."""
+        self.validate()
+
+        if not isinstance(self.metadata, MappingProxyType):
+            object.__setattr__(self, "metadata", MappingProxyType(dict(self.metadata)))
+
+        # Resolved here rather than stored in ``endpoint``, so dataclasses.replace
+        # with another protocol picks that protocol's default again
+        export_endpoint = self.endpoint or (
+            DEFAULT_GRPC_ENDPOINT if self.protocol == "grpc" else DEFAULT_HTTP_ENDPOINT
+        )
+        object.__setattr__(self, "export_endpoint", export_endpoint)
+        object.__setattr__(
+            self, "traces_endpoint", f"{export_endpoint.rstrip('/')}/v1/traces"
+        )
+
+        # Only add auth header if API key is provided. Lowercase header names
+        # are valid for both HTTP and gRPC metadata.
+        headers = {}
+        if self.api_key:
+            headers["authorization"] = f"{BEARER_PREFIX}{self.api_key}"
+        object.__setattr__(self, "export_headers", MappingProxyType(headers))
+
     def validate(self) -> None:
-        """Validate the configuration."""
+        """Validate the configuration.
+
+        Called automatically on construction, so an existing configuration
+        is always valid. Settings are only checked when tracing is enabled;
+        a disabled configuration never uses them.
+
+        Raises:
+            ValueError: If a setting is out of range.
+        """
+        if not self.enabled:
+            return
         # API key is optional for local development
         if self.batch_size < 1:
             raise ValueError("batch_size must be at least 1")
@@ -82,6 +181,14 @@ class HeimdallConfig:
             raise ValueError("flush_interval_ms must be at least 100")
         if self.max_queue_size < self.batch_size:
             raise ValueError("max_queue_size must be at least batch_size")
+        if self.export_timeout_ms < 1:
+            raise ValueError("export_timeout_ms must be at least 1")
+        if self.protocol not in SUPPORTED_PROTOCOLS:
+            raise ValueError(f"protocol must be one of {', '.join(SUPPORTED_PROTOCOLS)}")
+        if not 0.0 <= self.sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0.0 and 1.0")
+        if self.max_attribute_length < 0:
+            raise ValueError("max_attribute_length must not be negative")
     
     @classmethod
     def from_env(cls) -> "HeimdallConfig":
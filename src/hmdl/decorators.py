@@ -2,17 +2,33 @@
 
 from __future__ import annotations
 
-import base64
+import dataclasses
+import datetime
 import functools
 import inspect
 import json
+import sys
 import time
-from typing import Any, Callable, Dict, Optional, TypeVar, Union, overload
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 
-from hmdl.types import HeimdallAttributes, SpanKind, SpanStatus
+from hmdl.client import HeimdallClient
+from hmdl.types import DATACLASS_SLOTS, HeimdallAttributes, SpanKind, SpanStatus
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -24,123 +40,397 @@ UserExtractor = Callable[[tuple, dict], Optional[str]]
 # Takes (args, kwargs) and returns session ID string or None
 SessionExtractor = Callable[[tuple, dict], Optional[str]]
 
+
+def _json_default(value: Any) -> Any:
+    """Encode types the stdlib encoder rejects the way orjson does."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, Enum):
+        return value.value
+    # orjson writes dates and times as ISO 8601 rather than str()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _stdlib_json_dumps(value: Any) -> str:
+    """Encode with the stdlib in the same compact, non-ASCII-escaping form as orjson.
+
+    NaN and infinity are still written as ``NaN``/``Infinity``, where orjson
+    writes ``null``.
+    """
+    return json.dumps(value, default=_json_default, separators=(",", ":"), ensure_ascii=False)
+
+
+# Bound to orjson.loads or json.loads below, which take different parameters
+_json_loads: Callable[[Union[str, bytes]], Any]
+
+try:
+    # orjson is an optional, faster drop-in for encoding and decoding JSON
+    from orjson import OPT_NON_STR_KEYS
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+
+    def _json_dumps(value: Any) -> str:
+        try:
+            return _orjson_dumps(value, default=str, option=OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # orjson rejects some values the stdlib encodes, e.g. integers
+            # wider than 64 bits
+            return _stdlib_json_dumps(value)
+except ImportError:
+    from json import loads as _json_loads
+
+    _json_dumps = _stdlib_json_dumps
+
 # MCP header names
 MCP_SESSION_ID_HEADER = "Mcp-Session-Id"
 AUTHORIZATION_HEADER = "Authorization"
 
+# Lowercased header names used for case-insensitive matching
+_MCP_SESSION_ID_KEY = sys.intern(MCP_SESSION_ID_HEADER.lower())
+_AUTHORIZATION_KEY = sys.intern(AUTHORIZATION_HEADER.lower())
 
-def _parse_jwt_claims(token: str) -> Dict[str, Any]:
-    """Parse JWT claims from a token string (without verification)."""
+# JWT claims that may carry the user ID, in order of preference
+_USER_ID_CLAIMS = tuple(sys.intern(name) for name in ("sub", "user_id", "userId", "uid"))
+
+try:
+    # pybase64 is an optional, SIMD-accelerated base64 decoder
+    from pybase64 import urlsafe_b64decode as _b64url_decode
+except ImportError:
+    import binascii
+
+    # Maps the base64url alphabet onto standard base64 for binascii
+    _BASE64URL_TO_BASE64 = bytes.maketrans(b"-_", b"+/")
+
+    def _b64url_decode(data: bytes) -> bytes:
+        return binascii.a2b_base64(data.translate(_BASE64URL_TO_BASE64))
+
+
+def _strip_bearer(token: str) -> str:
+    """Strip an optional ``Bearer`` scheme prefix from an Authorization value."""
+    # Only lowercase the prefix; tokens are often kilobytes long
+    if token[:7].lower() == "bearer ":
+        return token[7:]
+    return token
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_jwt_claims(token: str) -> Dict[str, Any]:
+    """Decode the claims of a raw JWT (without verification).
+
+    Results are cached by token, so repeated requests carrying the same
+    Authorization header only pay for base64/JSON decoding once. The
+    returned dict is shared between callers and must not be mutated.
+    """
+    # Reject malformed tokens before split allocates anything
+    if token.count(".") != 2:
+        return {}
     try:
-        token_str = token
-        if token_str.lower().startswith("bearer "):
-            token_str = token_str[7:]
-        parts = token_str.split(".")
-        if len(parts) != 3:
-            return {}
-        payload = parts[1]
+        payload = token.split(".", 2)[1].encode("ascii")
         # Add padding if needed
-        padding = 4 - len(payload) % 4
-        if padding != 4:
-            payload += "=" * padding
-        decoded = base64.urlsafe_b64decode(payload).decode("utf-8")
-        return json.loads(decoded)
+        payload += b"=" * (-len(payload) % 4)
+        claims = _json_loads(_b64url_decode(payload))
+        return claims if isinstance(claims, dict) else {}
     except Exception:
         return {}
 
 
-def _extract_user_id_from_token(token: str) -> Optional[str]:
-    """Extract user ID from a JWT token."""
-    claims = _parse_jwt_claims(token)
-    # Check common user ID claims in order of preference
-    for claim in ["sub", "user_id", "userId", "uid"]:
-        if claim in claims and isinstance(claims[claim], str):
-            return claims[claim]
+def _parse_jwt_claims(token: str) -> Dict[str, Any]:
+    """Parse JWT claims from a token string (without verification)."""
+    return _decode_jwt_claims(_strip_bearer(token))
+
+
+def _user_id_from_claims(claims: Dict[str, Any]) -> Optional[str]:
+    """Pick the user ID out of already-parsed JWT claims."""
+    for claim in _USER_ID_CLAIMS:
+        value = claims.get(claim)
+        if isinstance(value, str):
+            return value
     return None
 
 
-def _extract_from_headers(headers: Dict[str, str]) -> tuple[Optional[str], Optional[str]]:
+def _extract_user_id_from_token(token: Union[str, Dict[str, Any]]) -> Optional[str]:
+    """Extract user ID from a JWT token or its already-parsed claims."""
+    claims = token if isinstance(token, dict) else _parse_jwt_claims(token)
+    return _user_id_from_claims(claims)
+
+
+def _extract_from_headers(headers: Mapping[str, str]) -> tuple[Optional[str], Optional[str]]:
     """Extract session ID and user ID from HTTP headers.
 
+    Header names are matched case-insensitively in a single pass, without
+    building a normalized copy of the headers.
+
     Returns:
         Tuple of (session_id, user_id)
     """
-    # Normalize headers to lowercase for case-insensitive lookup
-    normalized = {k.lower(): v for k, v in headers.items()}
-
-    session_id = normalized.get(MCP_SESSION_ID_HEADER.lower())
-    auth_header = normalized.get(AUTHORIZATION_HEADER.lower())
-    user_id = _extract_user_id_from_token(auth_header) if auth_header else None
+    session_id = None
+    auth_header = None
+    for key, value in headers.items():
+        lowered = key.lower()
+        if lowered == _MCP_SESSION_ID_KEY:
+            session_id = value
+        elif lowered == _AUTHORIZATION_KEY:
+            auth_header = value
+
+    user_id = None
+    if auth_header:
+        claims = _parse_jwt_claims(auth_header)
+        user_id = _user_id_from_claims(claims)
 
     return session_id, user_id
 
 
-def _serialize_value(value: Any) -> str:
-    """Safely serialize a value to string for span attributes."""
-    try:
-        return json.dumps(value, default=str)
-    except (TypeError, ValueError):
-        return str(value)
-
+# Appended to serialized values cut at the configured maximum length
+TRUNCATION_MARKER = "...[truncated]"
 
-def _get_client() -> Any:
-    """Get the Heimdall client instance."""
-    from hmdl.client import HeimdallClient
-    return HeimdallClient.get_instance()
 
+def _serialize_value(value: Any, max_length: int = 0) -> str:
+    """Safely serialize a value to string for span attributes.
 
-def _extract_session_id(
+    Results longer than ``max_length`` are truncated to at most
+    ``max_length`` characters, marker included; 0 means no limit.
+    """
+    # Scalars whose JSON form is trivial skip the encoder
+    value_type = type(value)
+    if value is None:
+        serialized = "null"
+    elif value_type is bool:
+        serialized = "true" if value else "false"
+    elif value_type is int:
+        serialized = str(value)
+    else:
+        try:
+            serialized = _json_dumps(value)
+        except (TypeError, ValueError):
+            serialized = str(value)
+    if max_length and len(serialized) > max_length:
+        keep = max_length - len(TRUNCATION_MARKER)
+        # Limits too short to fit the marker get a plain cut
+        if keep <= 0:
+            return serialized[:max_length]
+        return serialized[:keep] + TRUNCATION_MARKER
+    return serialized
+
+
+def _extract_ids(
     args: tuple,
     kwargs: dict,
     session_extractor: Optional[SessionExtractor],
+    user_extractor: Optional[UserExtractor],
     header_session_id: Optional[str],
-) -> Optional[str]:
-    """Extract session ID using the extractor callback or headers.
+    header_user_id: Optional[str],
+) -> Tuple[Optional[str], Optional[str]]:
+    """Extract the session and user IDs for a call in a single pass.
+
+    Priority for each: extractor callback > headers > None
 
-    Priority: session_extractor callback > headers > None
+    Returns:
+        Tuple of (session_id, user_id)
     """
-    # Try extractor callback first
+    session_id = header_session_id
     if session_extractor:
         try:
-            result = session_extractor(args, kwargs)
-            if result:
-                return result
+            session_id = session_extractor(args, kwargs) or header_session_id
         except Exception:
             # Ignore extraction errors
             pass
 
-    # Fall back to headers
-    if header_session_id:
-        return header_session_id
+    user_id = header_user_id
+    if user_extractor:
+        try:
+            user_id = user_extractor(args, kwargs) or header_user_id
+        except Exception:
+            # Ignore extraction errors
+            pass
 
-    return None
+    return session_id, user_id
 
 
-def _extract_user_id(
+# Attribute keys and values written on every traced call
+_STATUS_KEY = HeimdallAttributes.STATUS
+_STATUS_OK = SpanStatus.OK.value
+_STATUS_ERROR = SpanStatus.ERROR.value
+_DURATION_KEY = HeimdallAttributes.DURATION_MS
+_SESSION_KEY = HeimdallAttributes.HEIMDALL_SESSION_ID
+_USER_KEY = HeimdallAttributes.HEIMDALL_USER_ID
+
+# Status objects are immutable, so every successful span can share one
+_OK_STATUS = Status(StatusCode.OK)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class _SpanConfig:
+    """Decoration-time state shared by the sync and async wrappers."""
+
+    span_name: str
+    otel_span_kind: trace.SpanKind
+    static_attributes: Mapping[str, Any]
+    args_attr: str
+    result_attr: str
+    bind_arguments: Optional[Callable[[tuple, dict], Dict[str, Any]]]
+    capture_output: bool
+    set_current: bool = True
+    record_identity: bool = False
+    session_extractor: Optional[SessionExtractor] = None
+    user_extractor: Optional[UserExtractor] = None
+    header_session_id: Optional[str] = None
+    header_user_id: Optional[str] = None
+
+
+def _record_input(
+    span: trace.Span,
+    client: HeimdallClient,
+    cfg: _SpanConfig,
     args: tuple,
     kwargs: dict,
-    user_extractor: Optional[UserExtractor],
-    header_user_id: Optional[str],
-) -> Optional[str]:
-    """Extract user ID using the extractor callback or headers.
-
-    Priority: user_extractor callback > headers > None
-    """
-    # Try extractor callback first
-    if user_extractor:
+) -> None:
+    """Write the per-call input attributes of a traced call in one batch."""
+    attributes: Dict[str, Any] = {}
+
+    if cfg.record_identity:
+        # Priority: extractor > headers > client (> "anonymous" for the user)
+        session_id, user_id = _extract_ids(
+            args, kwargs, cfg.session_extractor, cfg.user_extractor,
+            cfg.header_session_id, cfg.header_user_id,
+        )
+        session_id = session_id or client.get_session_id()
+        if session_id:
+            attributes[_SESSION_KEY] = session_id
+        attributes[_USER_KEY] = user_id or client.get_user_id() or "anonymous"
+
+    if cfg.bind_arguments is not None and client.config.capture_input:
         try:
-            result = user_extractor(args, kwargs)
-            if result:
-                return result
+            attributes[cfg.args_attr] = _serialize_value(
+                cfg.bind_arguments(args, kwargs), client.config.max_attribute_length
+            )
         except Exception:
-            # Ignore extraction errors
             pass
 
-    # Fall back to headers
-    if header_user_id:
-        return header_user_id
+    if attributes:
+        span.set_attributes(attributes)
+
+
+def _record_output(
+    span: trace.Span,
+    client: HeimdallClient,
+    cfg: _SpanConfig,
+    result: Any,
+    start_ns: int,
+) -> None:
+    """Write the output attributes and OK status of a successful call."""
+    output: Dict[str, Any] = {
+        _STATUS_KEY: _STATUS_OK,
+        _DURATION_KEY: _elapsed_ms(start_ns),
+    }
+    if cfg.capture_output and client.config.capture_output:
+        output[cfg.result_attr] = _serialize_value(result, client.config.max_attribute_length)
+    span.set_attributes(output)
+    span.set_status(_OK_STATUS)
+
+
+def _record_exit(
+    span: trace.Span,
+    client: HeimdallClient,
+    error: BaseException,
+    start_ns: int,
+) -> None:
+    """Record a call that raised; only Exceptions are marked as errors."""
+    duration_ms = _elapsed_ms(start_ns)
+    if isinstance(error, Exception):
+        _record_error(span, error, duration_ms, client.config.record_exceptions)
+    else:
+        # Cancellation and interpreter exit are timed but not marked as errors
+        span.set_attribute(_DURATION_KEY, duration_ms)
+
+
+def _start_span(tracer: trace.Tracer, cfg: _SpanConfig) -> ContextManager[trace.Span]:
+    """Start the span for a traced call as a context manager that ends it.
+
+    The decoration-time attributes are passed at creation, so the span starts
+    with them (and samplers can see them) without a separate write.
+    """
+    # Errors are recorded by _record_exit, so the span itself must not record them again
+    if cfg.set_current:
+        return tracer.start_as_current_span(
+            name=cfg.span_name,
+            kind=cfg.otel_span_kind,
+            attributes=cfg.static_attributes,
+            record_exception=False,
+            set_status_on_exception=False,
+        )
+    # Spans are context managers that end themselves on exit; the current
+    # context is left untouched
+    return tracer.start_span(
+        name=cfg.span_name,
+        kind=cfg.otel_span_kind,
+        attributes=cfg.static_attributes,
+        record_exception=False,
+        set_status_on_exception=False,
+    )
+
+
+def _run_sync(cfg: _SpanConfig, func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+    """Call a sync function inside a span described by ``cfg``."""
+    client = HeimdallClient._instance
+    # No client, or a disabled one: call straight through without a span
+    if client is None or client._tracer is None:
+        return func(*args, **kwargs)
+
+    with _start_span(client._tracer, cfg) as span:
+        # Unsampled spans record nothing, so skip all attribute work
+        if not span.is_recording():
+            return func(*args, **kwargs)
+
+        _record_input(span, client, cfg, args, kwargs)
+        start_ns = time.perf_counter_ns()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            _record_exit(span, client, e, start_ns)
+            raise
+        _record_output(span, client, cfg, result, start_ns)
+        return result
+
+
+async def _run_async(cfg: _SpanConfig, func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+    """Await an async function inside a span described by ``cfg``."""
+    client = HeimdallClient._instance
+    # No client, or a disabled one: call straight through without a span
+    if client is None or client._tracer is None:
+        return await func(*args, **kwargs)
+
+    with _start_span(client._tracer, cfg) as span:
+        # Unsampled spans record nothing, so skip all attribute work
+        if not span.is_recording():
+            return await func(*args, **kwargs)
+
+        _record_input(span, client, cfg, args, kwargs)
+        start_ns = time.perf_counter_ns()
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            _record_exit(span, client, e, start_ns)
+            raise
+        _record_output(span, client, cfg, result, start_ns)
+        return result
 
-    return None
+
+def _wrap(func: F, cfg: _SpanConfig) -> F:
+    """Wrap ``func`` so each call runs inside a span described by ``cfg``."""
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapped(*args: Any, **kwargs: Any) -> Any:
+            return await _run_async(cfg, func, args, kwargs)
+
+        return async_wrapped  # type: ignore
+
+    @functools.wraps(func)
+    def sync_wrapped(*args: Any, **kwargs: Any) -> Any:
+        return _run_sync(cfg, func, args, kwargs)
+
+    return sync_wrapped  # type: ignore
 
 
 def _create_span_decorator(
@@ -154,148 +444,138 @@ def _create_span_decorator(
     def decorator(
         name: Optional[str] = None,
         *,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
         user_extractor: Optional[UserExtractor] = None,
         session_extractor: Optional[SessionExtractor] = None,
+        capture_input: bool = True,
+        capture_output: bool = True,
+        set_current: bool = True,
     ) -> Callable[[F], F]:
         # Pre-extract from headers if provided
         header_session_id, header_user_id = _extract_from_headers(headers) if headers else (None, None)
 
         def wrapper(func: F) -> F:
             span_name = name or func.__name__
-            is_async = inspect.iscoroutinefunction(func)
-
-            if is_async:
-                @functools.wraps(func)
-                async def async_wrapped(*args: Any, **kwargs: Any) -> Any:
-                    client = _get_client()
-                    if client is None:
-                        return await func(*args, **kwargs)
-
-                    tracer = client.tracer
-                    with tracer.start_as_current_span(
-                        name=span_name,
-                        kind=trace.SpanKind.SERVER,
-                    ) as span:
-                        start_time = time.perf_counter()
-
-                        # Set input attributes
-                        span.set_attribute(name_attr, span_name)
-                        span.set_attribute("heimdall.span_kind", span_kind.value)
-
-                        # Extract session ID - priority: extractor > headers > client
-                        session_id = _extract_session_id(args, kwargs, session_extractor, header_session_id)
-                        if not session_id:
-                            session_id = client.get_session_id()
-                        if session_id:
-                            span.set_attribute(HeimdallAttributes.HEIMDALL_SESSION_ID, session_id)
-
-                        # Extract user ID - priority: extractor > headers > client > "anonymous"
-                        user_id = _extract_user_id(args, kwargs, user_extractor, header_user_id)
-                        if not user_id:
-                            user_id = client.get_user_id()
-                        span.set_attribute(HeimdallAttributes.HEIMDALL_USER_ID, user_id or "anonymous")
-
-                        # Capture arguments
-                        try:
-                            all_args = _capture_arguments(func, args, kwargs)
-                            span.set_attribute(args_attr, _serialize_value(all_args))
-                        except Exception:
-                            pass
-
-                        try:
-                            result = await func(*args, **kwargs)
-
-                            # Set output attributes
-                            span.set_attribute(result_attr, _serialize_value(result))
-                            span.set_attribute(HeimdallAttributes.STATUS, SpanStatus.OK.value)
-                            span.set_status(Status(StatusCode.OK))
-
-                            return result
-                        except Exception as e:
-                            _record_error(span, e)
-                            raise
-                        finally:
-                            duration_ms = (time.perf_counter() - start_time) * 1000
-                            span.set_attribute(HeimdallAttributes.DURATION_MS, duration_ms)
-
-                return async_wrapped  # type: ignore
-            else:
-                @functools.wraps(func)
-                def sync_wrapped(*args: Any, **kwargs: Any) -> Any:
-                    client = _get_client()
-                    if client is None:
-                        return func(*args, **kwargs)
-
-                    tracer = client.tracer
-                    with tracer.start_as_current_span(
-                        name=span_name,
-                        kind=trace.SpanKind.SERVER,
-                    ) as span:
-                        start_time = time.perf_counter()
-
-                        # Set input attributes
-                        span.set_attribute(name_attr, span_name)
-                        span.set_attribute("heimdall.span_kind", span_kind.value)
-
-                        # Extract session ID - priority: extractor > headers > client
-                        session_id = _extract_session_id(args, kwargs, session_extractor, header_session_id)
-                        if not session_id:
-                            session_id = client.get_session_id()
-                        if session_id:
-                            span.set_attribute(HeimdallAttributes.HEIMDALL_SESSION_ID, session_id)
-
-                        # Extract user ID - priority: extractor > headers > client > "anonymous"
-                        user_id = _extract_user_id(args, kwargs, user_extractor, header_user_id)
-                        if not user_id:
-                            user_id = client.get_user_id()
-                        span.set_attribute(HeimdallAttributes.HEIMDALL_USER_ID, user_id or "anonymous")
-
-                        # Capture arguments
-                        try:
-                            all_args = _capture_arguments(func, args, kwargs)
-                            span.set_attribute(args_attr, _serialize_value(all_args))
-                        except Exception:
-                            pass
-
-                        try:
-                            result = func(*args, **kwargs)
-
-                            # Set output attributes
-                            span.set_attribute(result_attr, _serialize_value(result))
-                            span.set_attribute(HeimdallAttributes.STATUS, SpanStatus.OK.value)
-                            span.set_status(Status(StatusCode.OK))
-
-                            return result
-                        except Exception as e:
-                            _record_error(span, e)
-                            raise
-                        finally:
-                            duration_ms = (time.perf_counter() - start_time) * 1000
-                            span.set_attribute(HeimdallAttributes.DURATION_MS, duration_ms)
-
-                return sync_wrapped  # type: ignore
+            cfg = _SpanConfig(
+                span_name=span_name,
+                otel_span_kind=trace.SpanKind.SERVER,
+                static_attributes={
+                    name_attr: span_name,
+                    HeimdallAttributes.SPAN_KIND: span_kind.value,
+                },
+                args_attr=args_attr,
+                result_attr=result_attr,
+                # Without input capture the signature is never needed
+                bind_arguments=_make_argument_binder(func) if capture_input else None,
+                capture_output=capture_output,
+                set_current=set_current,
+                record_identity=True,
+                session_extractor=session_extractor,
+                user_extractor=user_extractor,
+                header_session_id=header_session_id,
+                header_user_id=header_user_id,
+            )
+            return _wrap(func, cfg)
 
         return wrapper
 
     return decorator
 
 
+def _get_signature(func: Callable[..., Any]) -> Optional[inspect.Signature]:
+    """Get the signature of a function, or None if it cannot be inspected."""
+    try:
+        return inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
+
+
+def _bind_arguments(signature: inspect.Signature, args: tuple, kwargs: dict) -> Dict[str, Any]:
+    """Bind call arguments to a precomputed signature, including defaults."""
+    bound = signature.bind_partial(*args, **kwargs)
+    bound.apply_defaults()
+    # BoundArguments.arguments is already a fresh dict, no copy needed
+    return bound.arguments
+
+
+# Parameter kinds the fast argument binder handles; anything else (positional-only,
+# *args, **kwargs) goes through Signature.bind_partial.
+_SIMPLE_PARAMETER_KINDS = (
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+
+
+def _make_argument_binder(
+    func: Callable[..., Any],
+) -> Optional[Callable[[tuple, dict], Dict[str, Any]]]:
+    """Build a callable mapping call arguments to parameter names for ``func``.
+
+    For plain signatures the parameter names and defaults are resolved once,
+    so binding is a couple of dict operations instead of a full
+    ``Signature.bind_partial``. Arguments are returned in signature order.
+    Returns None if the signature cannot be inspected.
+    """
+    signature = _get_signature(func)
+    if signature is None:
+        return None
+
+    parameters = list(signature.parameters.values())
+    if any(param.kind not in _SIMPLE_PARAMETER_KINDS for param in parameters):
+        return functools.partial(_bind_arguments, signature)
+
+    names = tuple(param.name for param in parameters)
+    positional_names = tuple(
+        param.name for param in parameters
+        if param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+    )
+    defaults = {
+        param.name: param.default for param in parameters
+        if param.default is not inspect.Parameter.empty
+    }
+
+    def bind(args: tuple, kwargs: dict) -> Dict[str, Any]:
+        arguments = dict(zip(positional_names, args))
+        for param_name in names[len(arguments):]:
+            if param_name in kwargs:
+                arguments[param_name] = kwargs[param_name]
+            elif param_name in defaults:
+                arguments[param_name] = defaults[param_name]
+        return arguments
+
+    return bind
+
+
 def _capture_arguments(func: Callable[..., Any], args: tuple, kwargs: dict) -> dict:
     """Capture function arguments as a dictionary."""
-    sig = inspect.signature(func)
-    bound = sig.bind_partial(*args, **kwargs)
-    bound.apply_defaults()
-    return dict(bound.arguments)
+    return _bind_arguments(inspect.signature(func), args, kwargs)
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds elapsed since a ``time.perf_counter_ns()`` reading."""
+    # Integer subtraction keeps full precision; one division converts to ms
+    return (time.perf_counter_ns() - start_ns) / 1e6
 
 
-def _record_error(span: trace.Span, error: Exception) -> None:
+def _record_error(
+    span: trace.Span,
+    error: Exception,
+    duration_ms: Optional[float] = None,
+    record_exception: bool = True,
+) -> None:
     """Record an error on a span."""
-    span.set_attribute(HeimdallAttributes.STATUS, SpanStatus.ERROR.value)
-    span.set_attribute(HeimdallAttributes.ERROR_MESSAGE, str(error))
-    span.set_attribute(HeimdallAttributes.ERROR_TYPE, type(error).__name__)
-    span.set_status(Status(StatusCode.ERROR, str(error)))
-    span.record_exception(error)
+    message = str(error)
+    attributes: Dict[str, Any] = {
+        _STATUS_KEY: _STATUS_ERROR,
+        HeimdallAttributes.ERROR_MESSAGE: message,
+        HeimdallAttributes.ERROR_TYPE: type(error).__name__,
+    }
+    if duration_ms is not None:
+        attributes[_DURATION_KEY] = duration_ms
+    span.set_attributes(attributes)
+    span.set_status(Status(StatusCode.ERROR, message))
+    if record_exception:
+        span.record_exception(error)
 
 
 # Create MCP-specific decorators
@@ -316,6 +596,11 @@ Args:
     session_extractor: Function to extract session ID from (args, kwargs).
         Useful for extracting session info from MCP Context.
         Returns session ID string or None to use default from client.
+    capture_input: Record the function arguments (default True).
+    capture_output: Record the return value (default True).
+    set_current: Make the span current while the function runs (default True).
+        Disable for leaf functions that never start child spans to skip the
+        context switch.
 
 Example:
     >>> @trace_mcp_tool()
@@ -338,8 +623,8 @@ Example:
 trace_mcp_resource = _create_span_decorator(
     span_kind=SpanKind.MCP_RESOURCE,
     name_attr=HeimdallAttributes.MCP_RESOURCE_URI,
-    args_attr="mcp.resource.arguments",
-    result_attr="mcp.resource.result",
+    args_attr=HeimdallAttributes.MCP_RESOURCE_ARGUMENTS,
+    result_attr=HeimdallAttributes.MCP_RESOURCE_RESULT,
 )
 trace_mcp_resource.__doc__ = """
 Decorator to trace MCP resource access.
@@ -375,6 +660,7 @@ def observe(
     *,
     capture_input: bool = True,
     capture_output: bool = True,
+    set_current: bool = True,
 ) -> Callable[[F], F]: ...
 
 def observe(
@@ -383,6 +669,7 @@ def observe(
     *,
     capture_input: bool = True,
     capture_output: bool = True,
+    set_current: bool = True,
 ) -> Union[F, Callable[[F], F]]:
     """
     General-purpose decorator to observe any function.
@@ -399,81 +686,17 @@ def observe(
         ...     pass
     """
     def decorator(fn: F) -> F:
-        span_name = name or fn.__name__
-        is_async = inspect.iscoroutinefunction(fn)
-
-        if is_async:
-            @functools.wraps(fn)
-            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                client = _get_client()
-                if client is None:
-                    return await fn(*args, **kwargs)
-
-                tracer = client.tracer
-                with tracer.start_as_current_span(
-                    name=span_name,
-                    kind=trace.SpanKind.INTERNAL,
-                ) as span:
-                    start_time = time.perf_counter()
-                    span.set_attribute("heimdall.span_kind", SpanKind.INTERNAL.value)
-
-                    if capture_input:
-                        try:
-                            all_args = _capture_arguments(fn, args, kwargs)
-                            span.set_attribute("heimdall.input", _serialize_value(all_args))
-                        except Exception:
-                            pass
-
-                    try:
-                        result = await fn(*args, **kwargs)
-                        if capture_output:
-                            span.set_attribute("heimdall.output", _serialize_value(result))
-                        span.set_status(Status(StatusCode.OK))
-                        return result
-                    except Exception as e:
-                        _record_error(span, e)
-                        raise
-                    finally:
-                        duration_ms = (time.perf_counter() - start_time) * 1000
-                        span.set_attribute(HeimdallAttributes.DURATION_MS, duration_ms)
-
-            return async_wrapper  # type: ignore
-        else:
-            @functools.wraps(fn)
-            def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-                client = _get_client()
-                if client is None:
-                    return fn(*args, **kwargs)
-
-                tracer = client.tracer
-                with tracer.start_as_current_span(
-                    name=span_name,
-                    kind=trace.SpanKind.INTERNAL,
-                ) as span:
-                    start_time = time.perf_counter()
-                    span.set_attribute("heimdall.span_kind", SpanKind.INTERNAL.value)
-
-                    if capture_input:
-                        try:
-                            all_args = _capture_arguments(fn, args, kwargs)
-                            span.set_attribute("heimdall.input", _serialize_value(all_args))
-                        except Exception:
-                            pass
-
-                    try:
-                        result = fn(*args, **kwargs)
-                        if capture_output:
-                            span.set_attribute("heimdall.output", _serialize_value(result))
-                        span.set_status(Status(StatusCode.OK))
-                        return result
-                    except Exception as e:
-                        _record_error(span, e)
-                        raise
-                    finally:
-                        duration_ms = (time.perf_counter() - start_time) * 1000
-                        span.set_attribute(HeimdallAttributes.DURATION_MS, duration_ms)
-
-            return sync_wrapper  # type: ignore
+        cfg = _SpanConfig(
+            span_name=name or fn.__name__,
+            otel_span_kind=trace.SpanKind.INTERNAL,
+            static_attributes={HeimdallAttributes.SPAN_KIND: SpanKind.INTERNAL.value},
+            args_attr=HeimdallAttributes.INPUT,
+            result_attr=HeimdallAttributes.OUTPUT,
+            bind_arguments=_make_argument_binder(fn) if capture_input else None,
+            capture_output=capture_output,
+            set_current=set_current,
+        )
+        return _wrap(fn, cfg)
 
     # Handle both @observe and @observe() syntax
     if func is not None:
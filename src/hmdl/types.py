@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import sys
+import time
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, List
-from datetime import datetime
+from typing import Any, Dict, Final, FrozenSet, NamedTuple, Optional, Tuple, final
+from datetime import datetime, timedelta, timezone
+
+# Keyword arguments that give dataclasses ``__slots__`` where supported
+# (``dataclass(slots=True)`` requires Python 3.10+).
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class SpanKind(str, Enum):
@@ -28,20 +34,39 @@ class SpanStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
-class MCPToolCall:
-    """Represents an MCP tool call."""
+class _Timestamped:
+    """Mixin exposing ``timestamp_ns`` as a UTC datetime."""
+
+    __slots__ = ()
+
+    timestamp_ns: int
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a timezone-aware UTC datetime, built on access."""
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        created = datetime.fromtimestamp(seconds, tz=timezone.utc)
+        return created + timedelta(microseconds=nanos // 1000)
+
+
+@dataclass(**DATACLASS_SLOTS)
+class MCPToolCall(_Timestamped):
+    """Represents an MCP tool call.
+
+    ``arguments`` defaults to ``None`` rather than an empty dict; treat
+    ``None`` as empty.
+    """
     
     name: str
-    arguments: Dict[str, Any] = field(default_factory=dict)
+    arguments: Optional[Dict[str, Any]] = None
     result: Optional[Any] = None
     error: Optional[str] = None
     duration_ms: Optional[float] = None
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=time.time_ns)
 
 
-@dataclass
-class MCPResourceAccess:
+@dataclass(**DATACLASS_SLOTS)
+class MCPResourceAccess(_Timestamped):
     """Represents an MCP resource access."""
     
     uri: str
@@ -50,65 +75,136 @@ class MCPResourceAccess:
     content_length: Optional[int] = None
     error: Optional[str] = None
     duration_ms: Optional[float] = None
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+
+class PromptMessage(NamedTuple):
+    """A single message rendered by an MCP prompt."""
 
+    role: str
+    content: Any
 
-@dataclass
-class MCPPromptCall:
-    """Represents an MCP prompt call."""
+
+@dataclass(**DATACLASS_SLOTS)
+class MCPPromptCall(_Timestamped):
+    """Represents an MCP prompt call.
+
+    ``arguments`` defaults to ``None`` rather than an empty dict; treat
+    ``None`` as empty. ``messages`` is an immutable tuple; build a new one
+    to add messages.
+    """
     
     name: str
-    arguments: Dict[str, Any] = field(default_factory=dict)
-    messages: List[Dict[str, Any]] = field(default_factory=list)
+    arguments: Optional[Dict[str, Any]] = None
+    messages: Tuple[PromptMessage, ...] = ()
     error: Optional[str] = None
     duration_ms: Optional[float] = None
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=time.time_ns)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TraceContext:
-    """Context for a trace."""
+    """Context for a trace.
+
+    ``metadata`` defaults to ``None`` rather than an empty dict; treat
+    ``None`` as empty. ``tags`` is an immutable set; add tags with
+    ``tags | {"new-tag"}``.
+    """
     
     trace_id: str
     span_id: str
     parent_span_id: Optional[str] = None
     session_id: Optional[str] = None
     user_id: Optional[str] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    tags: List[str] = field(default_factory=list)
+    metadata: Optional[Dict[str, Any]] = None
+    tags: FrozenSet[str] = frozenset()
+
+
+# Attribute keys for OpenTelemetry spans. Interned once so the SDK's attribute
+# dicts hash and compare them by identity on each write.
+
+# MCP specific attributes
+MCP_TOOL_NAME: Final[str] = sys.intern("mcp.tool.name")
+MCP_TOOL_ARGUMENTS: Final[str] = sys.intern("mcp.tool.arguments")
+MCP_TOOL_RESULT: Final[str] = sys.intern("mcp.tool.result")
+
+MCP_RESOURCE_URI: Final[str] = sys.intern("mcp.resource.uri")
+MCP_RESOURCE_METHOD: Final[str] = sys.intern("mcp.resource.method")
+MCP_RESOURCE_CONTENT_TYPE: Final[str] = sys.intern("mcp.resource.content_type")
+MCP_RESOURCE_CONTENT_LENGTH: Final[str] = sys.intern("mcp.resource.content_length")
+MCP_RESOURCE_ARGUMENTS: Final[str] = sys.intern("mcp.resource.arguments")
+MCP_RESOURCE_RESULT: Final[str] = sys.intern("mcp.resource.result")
+
+MCP_PROMPT_NAME: Final[str] = sys.intern("mcp.prompt.name")
+MCP_PROMPT_ARGUMENTS: Final[str] = sys.intern("mcp.prompt.arguments")
+MCP_PROMPT_MESSAGES: Final[str] = sys.intern("mcp.prompt.messages")
+
+# Heimdall specific attributes
+HEIMDALL_SESSION_ID: Final[str] = sys.intern("heimdall.session_id")
+HEIMDALL_USER_ID: Final[str] = sys.intern("heimdall.user_id")
+HEIMDALL_ENVIRONMENT: Final[str] = sys.intern("heimdall.environment")
+HEIMDALL_SERVICE_NAME: Final[str] = sys.intern("heimdall.service_name")
+HEIMDALL_ORG_ID: Final[str] = sys.intern("heimdall.org_id")
+HEIMDALL_PROJECT_ID: Final[str] = sys.intern("heimdall.project_id")
+SPAN_KIND: Final[str] = sys.intern("heimdall.span_kind")
 
+# Generic input/output attributes (used by ``observe``)
+INPUT: Final[str] = sys.intern("heimdall.input")
+OUTPUT: Final[str] = sys.intern("heimdall.output")
 
-# Attribute keys for OpenTelemetry spans
+# Status and error attributes
+STATUS: Final[str] = sys.intern("heimdall.status")
+ERROR_MESSAGE: Final[str] = sys.intern("heimdall.error.message")
+ERROR_TYPE: Final[str] = sys.intern("heimdall.error.type")
+
+# Timing attributes
+DURATION_MS: Final[str] = sys.intern("heimdall.duration_ms")
+
+
+@final
 class HeimdallAttributes:
-    """Standard attribute keys for Heimdall spans."""
-    
+    """Standard attribute keys for Heimdall spans.
+
+    Namespace over the module-level constants, kept for compatibility. It is
+    never instantiated or subclassed; hot paths should import the module-level
+    constants directly.
+    """
+
+    __slots__ = ()
+
     # MCP specific attributes
-    MCP_TOOL_NAME = "mcp.tool.name"
-    MCP_TOOL_ARGUMENTS = "mcp.tool.arguments"
-    MCP_TOOL_RESULT = "mcp.tool.result"
-    
-    MCP_RESOURCE_URI = "mcp.resource.uri"
-    MCP_RESOURCE_METHOD = "mcp.resource.method"
-    MCP_RESOURCE_CONTENT_TYPE = "mcp.resource.content_type"
-    MCP_RESOURCE_CONTENT_LENGTH = "mcp.resource.content_length"
-    
-    MCP_PROMPT_NAME = "mcp.prompt.name"
-    MCP_PROMPT_ARGUMENTS = "mcp.prompt.arguments"
-    MCP_PROMPT_MESSAGES = "mcp.prompt.messages"
-    
+    MCP_TOOL_NAME = MCP_TOOL_NAME
+    MCP_TOOL_ARGUMENTS = MCP_TOOL_ARGUMENTS
+    MCP_TOOL_RESULT = MCP_TOOL_RESULT
+
+    MCP_RESOURCE_URI = MCP_RESOURCE_URI
+    MCP_RESOURCE_METHOD = MCP_RESOURCE_METHOD
+    MCP_RESOURCE_CONTENT_TYPE = MCP_RESOURCE_CONTENT_TYPE
+    MCP_RESOURCE_CONTENT_LENGTH = MCP_RESOURCE_CONTENT_LENGTH
+    MCP_RESOURCE_ARGUMENTS = MCP_RESOURCE_ARGUMENTS
+    MCP_RESOURCE_RESULT = MCP_RESOURCE_RESULT
+
+    MCP_PROMPT_NAME = MCP_PROMPT_NAME
+    MCP_PROMPT_ARGUMENTS = MCP_PROMPT_ARGUMENTS
+    MCP_PROMPT_MESSAGES = MCP_PROMPT_MESSAGES
+
     # Heimdall specific attributes
-    HEIMDALL_SESSION_ID = "heimdall.session_id"
-    HEIMDALL_USER_ID = "heimdall.user_id"
-    HEIMDALL_ENVIRONMENT = "heimdall.environment"
-    HEIMDALL_SERVICE_NAME = "heimdall.service_name"
-    HEIMDALL_ORG_ID = "heimdall.org_id"
-    HEIMDALL_PROJECT_ID = "heimdall.project_id"
-    
+    HEIMDALL_SESSION_ID = HEIMDALL_SESSION_ID
+    HEIMDALL_USER_ID = HEIMDALL_USER_ID
+    HEIMDALL_ENVIRONMENT = HEIMDALL_ENVIRONMENT
+    HEIMDALL_SERVICE_NAME = HEIMDALL_SERVICE_NAME
+    HEIMDALL_ORG_ID = HEIMDALL_ORG_ID
+    HEIMDALL_PROJECT_ID = HEIMDALL_PROJECT_ID
+    SPAN_KIND = SPAN_KIND
+
+    # Generic input/output attributes (used by ``observe``)
+    INPUT = INPUT
+    OUTPUT = OUTPUT
+
     # Status and error attributes
-    STATUS = "heimdall.status"
-    ERROR_MESSAGE = "heimdall.error.message"
-    ERROR_TYPE = "heimdall.error.type"
-    
-    # Timing attributes
-    DURATION_MS = "heimdall.duration_ms"
+    STATUS = STATUS
+    ERROR_MESSAGE = ERROR_MESSAGE
+    ERROR_TYPE = ERROR_TYPE
 
+    # Timing attributes
+    DURATION_MS = DURATION_MS
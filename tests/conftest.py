@@ -1,8 +1,10 @@
 """Pytest configuration and fixtures."""
 
+import importlib.util
 import os
+import sys
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 # Set test environment variables before importing SDK
 os.environ["HEIMDALL_API_KEY"] = "test-api-key"
@@ -21,31 +23,109 @@ def reset_client():
     HeimdallClient.reset()
 
 
+class StubSpan:
+    """Lightweight span that records what the SDK writes to it."""
+
+    def __init__(self):
+        self.attributes = {}
+        self.calls = []
+        self.status = None
+        self.exceptions = []
+        self.recording = True
+        self.ended = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.ended = True
+        return False
+
+    def is_recording(self):
+        return self.recording
+
+    def set_attribute(self, key, value):
+        self.calls.append("set_attribute")
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes):
+        self.calls.append("set_attributes")
+        self.attributes.update(attributes)
+
+    def set_status(self, status):
+        self.status = status
+
+    def record_exception(self, exception, *args, **kwargs):
+        self.exceptions.append(exception)
+
+    def end(self):
+        self.ended = True
+
+
+class StubTracer:
+    """Tracer that hands out a single StubSpan and records how it was started."""
+
+    def __init__(self, span):
+        self.span = span
+        self.started = []
+
+    def start_as_current_span(self, name, **kwargs):
+        return self._start("start_as_current_span", name, kwargs)
+
+    def start_span(self, name, **kwargs):
+        return self._start("start_span", name, kwargs)
+
+    def _start(self, method, name, kwargs):
+        self.started.append((method, name, kwargs))
+        # Like the SDK, only a recording span keeps its start attributes
+        if self.span.recording:
+            self.span.attributes.update(kwargs.get("attributes") or {})
+        return self.span
+
+
 @pytest.fixture
 def mock_tracer():
-    """Create a mock tracer for testing."""
-    mock = MagicMock()
-    mock_span = MagicMock()
-    mock_span.__enter__ = MagicMock(return_value=mock_span)
-    mock_span.__exit__ = MagicMock(return_value=False)
-    mock.start_as_current_span.return_value = mock_span
-    return mock, mock_span
+    """Create a stub tracer and span for testing."""
+    span = StubSpan()
+    return StubTracer(span), span
 
 
 @pytest.fixture
 def enabled_client(mock_tracer):
     """Create a client with tracing enabled but mocked."""
     from hmdl.client import HeimdallClient
-    
+    from hmdl.config import HeimdallConfig
+
     mock, mock_span = mock_tracer
-    
-    with patch.dict(os.environ, {"HEIMDALL_ENABLED": "true"}):
-        with patch("hmdl.client.OTLPSpanExporter"):
-            with patch("hmdl.client.BatchSpanProcessor"):
-                with patch("hmdl.client.TracerProvider"):
-                    with patch("hmdl.client.trace") as mock_trace:
-                        mock_trace.get_tracer.return_value = mock
-                        client = HeimdallClient()
-                        client._tracer = mock
-                        yield client, mock, mock_span
 
+    with patch("hmdl.client.OTLPSpanExporter"):
+        with patch("hmdl.client.BatchSpanProcessor"):
+            with patch("hmdl.client.TracerProvider"):
+                with patch("hmdl.client.trace") as mock_trace:
+                    mock_trace.get_tracer.return_value = mock
+                    client = HeimdallClient(config=HeimdallConfig(enabled=True))
+                    client._tracer = mock
+                    yield client, mock, mock_span
+
+
+@pytest.fixture
+def load_decorators(monkeypatch):
+    """Load a separate copy of hmdl.decorators with some modules replaced.
+
+    Map a module name to None to make importing it fail. The copy is loaded
+    under its own name, so the real hmdl.decorators is left untouched.
+    """
+    import hmdl.decorators
+
+    def load(**modules):
+        for name, module in modules.items():
+            monkeypatch.setitem(sys.modules, name, module)
+        spec = importlib.util.spec_from_file_location(
+            "hmdl_decorators_copy", hmdl.decorators.__file__
+        )
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, spec.name, module)
+        spec.loader.exec_module(module)
+        return module
+
+    return load
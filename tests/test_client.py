@@ -18,13 +18,60 @@ class TestHeimdallClient:
         
         assert client1 is client2
 
+    def test_repeated_construction_reuses_initialized_client(self):
+        """Test later constructions return the client without re-initializing it."""
+        client1 = HeimdallClient(service_name="first-service")
+
+        with patch("hmdl.client.HeimdallConfig") as mock_config:
+            client2 = HeimdallClient(service_name="second-service")
+
+        assert client2 is client1
+        assert client2.config.service_name == "first-service"
+        mock_config.assert_not_called()
+
+    def test_concurrent_construction_initializes_once(self):
+        """Test threads racing to create the client share one initialization."""
+        import threading
+
+        barrier = threading.Barrier(8)
+        clients = []
+
+        def create():
+            barrier.wait()
+            clients.append(HeimdallClient())
+
+        with patch("hmdl.client.HeimdallConfig", wraps=HeimdallConfig) as mock_config:
+            threads = [threading.Thread(target=create) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(clients) == 8
+        assert all(client is clients[0] for client in clients)
+        mock_config.assert_called_once()
+
+    def test_instance_published_after_initialization(self):
+        """Test the singleton is only visible once __init__ has finished."""
+        seen_during_init = []
+
+        def build_config(**kwargs):
+            seen_during_init.append(HeimdallClient.get_instance())
+            return HeimdallConfig(**kwargs)
+
+        with patch("hmdl.client.HeimdallConfig", side_effect=build_config):
+            client = HeimdallClient()
+
+        assert seen_during_init == [None]
+        assert HeimdallClient.get_instance() is client
+        assert HeimdallClient() is client
+
     def test_disabled_client_no_tracer(self):
         """Test that disabled client has no tracer setup."""
-        with patch.dict(os.environ, {"HEIMDALL_ENABLED": "false"}):
-            client = HeimdallClient()
-            
-            assert client._tracer is None
-            assert client._provider is None
+        client = HeimdallClient(config=HeimdallConfig(enabled=False))
+
+        assert client._tracer is None
+        assert client._provider is None
 
     def test_get_instance(self):
         """Test get_instance class method."""
@@ -43,25 +90,41 @@ class TestHeimdallClient:
         
         assert HeimdallClient.get_instance() is None
 
+    def test_reset_unregisters_atexit_hook(self):
+        """Test reset removes the client's atexit shutdown hook."""
+        with patch("hmdl.client.atexit") as mock_atexit:
+            client = HeimdallClient()
+            mock_atexit.register.assert_called_once_with(client.shutdown)
+
+            HeimdallClient.reset()
+
+        mock_atexit.unregister.assert_called_once_with(client.shutdown)
+
     def test_tracer_property_returns_noop_when_disabled(self):
         """Test tracer property returns no-op tracer when disabled."""
-        with patch.dict(os.environ, {"HEIMDALL_ENABLED": "false"}):
-            client = HeimdallClient()
-            tracer = client.tracer
-            
-            # Should return a tracer (no-op)
-            assert tracer is not None
+        client = HeimdallClient(config=HeimdallConfig(enabled=False))
+        tracer = client.tracer
+
+        # Should return a tracer (no-op)
+        assert tracer is not None
 
     def test_config_from_arguments(self):
         """Test client accepts config arguments."""
-        with patch.dict(os.environ, {"HEIMDALL_ENABLED": "false"}):
-            client = HeimdallClient(
-                api_key="arg-key",
-                service_name="arg-service",
-            )
-            
-            assert client.config.api_key == "arg-key"
-            assert client.config.service_name == "arg-service"
+        client = HeimdallClient(
+            api_key="arg-key",
+            service_name="arg-service",
+        )
+
+        assert client.config.api_key == "arg-key"
+        assert client.config.service_name == "arg-service"
+
+    def test_config_arguments_fall_back_to_env(self):
+        """Test omitted config arguments use environment defaults."""
+        client = HeimdallClient(api_key="arg-key", endpoint="")
+
+        assert client.config.api_key == "arg-key"
+        assert client.config.endpoint == "https://test.heimdall.dev"
+        assert client.config.environment == "test"
 
     def test_config_object(self):
         """Test client accepts config object."""
@@ -76,30 +139,107 @@ class TestHeimdallClient:
         assert client.config.api_key == "config-key"
         assert client.config.service_name == "config-service"
 
+    def test_batch_processor_uses_config(self):
+        """Test export settings are passed to the batch span processor."""
+        config = HeimdallConfig(
+            enabled=True,
+            batch_size=50,
+            max_queue_size=500,
+            flush_interval_ms=1000,
+            export_timeout_ms=2000,
+        )
+
+        with patch("hmdl.client.OTLPSpanExporter") as mock_exporter, \
+                patch("hmdl.client.BatchSpanProcessor") as mock_processor, \
+                patch("hmdl.client.TracerProvider"), \
+                patch("hmdl.client.trace"):
+            HeimdallClient(config=config)
+
+        assert mock_exporter.call_args.kwargs["timeout"] == 2.0
+        mock_processor.assert_called_once_with(
+            mock_exporter.return_value,
+            max_queue_size=500,
+            max_export_batch_size=50,
+            schedule_delay_millis=1000,
+            export_timeout_millis=2000,
+        )
+
+    def test_sample_rate_configures_sampler(self):
+        """Test a sample rate below 1.0 installs a ratio-based sampler."""
+        config = HeimdallConfig(enabled=True, sample_rate=0.25)
+
+        with patch("hmdl.client.OTLPSpanExporter"), \
+                patch("hmdl.client.BatchSpanProcessor"), \
+                patch("hmdl.client.TracerProvider") as mock_provider, \
+                patch("hmdl.client.trace"):
+            HeimdallClient(config=config)
+
+        sampler = mock_provider.call_args.kwargs["sampler"]
+        assert "TraceIdRatioBased{0.25}" in sampler.get_description()
+
+    def test_grpc_protocol_uses_grpc_exporter(self, monkeypatch):
+        """Test the gRPC protocol selects the gRPC exporter on the OTLP/gRPC port."""
+        monkeypatch.delenv("HEIMDALL_ENDPOINT")
+        config = HeimdallConfig(enabled=True, api_key="key", protocol="grpc")
+
+        with patch("hmdl.client.OTLPSpanExporter") as mock_http_exporter, \
+                patch(
+                    "opentelemetry.exporter.otlp.proto.grpc.trace_exporter.OTLPSpanExporter"
+                ) as mock_grpc_exporter, \
+                patch("hmdl.client.BatchSpanProcessor"), \
+                patch("hmdl.client.TracerProvider"), \
+                patch("hmdl.client.trace"):
+            HeimdallClient(config=config)
+
+        mock_http_exporter.assert_not_called()
+        mock_grpc_exporter.assert_called_once_with(
+            endpoint="http://localhost:4317",
+            headers={"authorization": "Bearer key"},
+            timeout=10.0,
+        )
+
+    def test_debug_does_not_configure_root_logger(self):
+        """Test debug mode only changes the hmdl logger level."""
+        import logging
+
+        config = HeimdallConfig(enabled=True, debug=True)
+        hmdl_logger = logging.getLogger("hmdl")
+        previous_level = hmdl_logger.level
+
+        try:
+            with patch("hmdl.client.OTLPSpanExporter"), \
+                    patch("hmdl.client.BatchSpanProcessor"), \
+                    patch("hmdl.client.TracerProvider"), \
+                    patch("hmdl.client.trace"), \
+                    patch("logging.basicConfig") as mock_basic_config:
+                HeimdallClient(config=config)
+
+            mock_basic_config.assert_not_called()
+            assert hmdl_logger.level == logging.DEBUG
+        finally:
+            hmdl_logger.setLevel(previous_level)
+
     def test_flush_when_disabled(self):
         """Test flush does nothing when disabled."""
-        with patch.dict(os.environ, {"HEIMDALL_ENABLED": "false"}):
-            client = HeimdallClient()
-            
-            # Should not raise
-            client.flush()
+        client = HeimdallClient(config=HeimdallConfig(enabled=False))
+
+        # Should not raise
+        client.flush()
 
     def test_shutdown_when_disabled(self):
         """Test shutdown does nothing when disabled."""
-        with patch.dict(os.environ, {"HEIMDALL_ENABLED": "false"}):
-            client = HeimdallClient()
-            
-            # Should not raise
-            client.shutdown()
+        client = HeimdallClient(config=HeimdallConfig(enabled=False))
+
+        # Should not raise
+        client.shutdown()
 
     def test_get_current_span(self):
         """Test get_current_span returns current span."""
-        with patch.dict(os.environ, {"HEIMDALL_ENABLED": "false"}):
-            client = HeimdallClient()
+        client = HeimdallClient(config=HeimdallConfig(enabled=False))
 
-            # Should return a span (possibly invalid/no-op)
-            span = client.get_current_span()
-            assert span is not None
+        # Should return a span (possibly invalid/no-op)
+        span = client.get_current_span()
+        assert span is not None
 
 
 class TestSessionAndUserIdManagement:
@@ -107,35 +247,123 @@ class TestSessionAndUserIdManagement:
 
     def test_get_and_set_session_id(self):
         """Test get_session_id and set_session_id methods."""
-        with patch.dict(os.environ, {"HEIMDALL_ENABLED": "false"}):
-            client = HeimdallClient()
+        client = HeimdallClient(config=HeimdallConfig(enabled=False))
 
-            # Initially undefined
-            assert client.get_session_id() is None
+        # Initially undefined
+        assert client.get_session_id() is None
 
-            # Set session ID
-            client.set_session_id("session-123")
-            assert client.get_session_id() == "session-123"
+        # Set session ID
+        client.set_session_id("session-123")
+        assert client.get_session_id() == "session-123"
 
-            # Clear session ID
-            client.set_session_id(None)
-            assert client.get_session_id() is None
+        # Clear session ID
+        client.set_session_id(None)
+        assert client.get_session_id() is None
 
     def test_get_and_set_user_id(self):
         """Test get_user_id and set_user_id methods."""
-        with patch.dict(os.environ, {"HEIMDALL_ENABLED": "false"}):
-            client = HeimdallClient()
+        client = HeimdallClient(config=HeimdallConfig(enabled=False))
+
+        # Initially undefined
+        assert client.get_user_id() is None
+
+        # Set user ID
+        client.set_user_id("user-456")
+        assert client.get_user_id() == "user-456"
+
+        # Clear user ID
+        client.set_user_id(None)
+        assert client.get_user_id() is None
+
+    def test_session_id_is_scoped_to_async_task(self):
+        """Test concurrent tasks each see the session ID they set."""
+        import asyncio
+
+        client = HeimdallClient(config=HeimdallConfig(enabled=False))
+
+        async def handle(session_id):
+            client.set_session_id(session_id)
+            await asyncio.sleep(0)
+            return client.get_session_id()
 
-            # Initially undefined
-            assert client.get_user_id() is None
+        async def main():
+            return await asyncio.gather(handle("session-a"), handle("session-b"))
 
-            # Set user ID
-            client.set_user_id("user-456")
-            assert client.get_user_id() == "user-456"
+        assert asyncio.run(main()) == ["session-a", "session-b"]
+        # Elsewhere the last value set is the process-wide default
+        assert client.get_session_id() == "session-b"
+
+    def test_ids_set_once_are_seen_from_threads_and_executors(self):
+        """Test IDs set at connect time apply to other threads and executor calls."""
+        import asyncio
+        import threading
+
+        client = HeimdallClient(config=HeimdallConfig(enabled=False))
+        client.set_session_id("session-123")
+        client.set_user_id("user-456")
+
+        def read_ids():
+            return client.get_session_id(), client.get_user_id()
+
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(read_ids()))
+        thread.start()
+        thread.join()
+
+        async def from_executor():
+            return await asyncio.get_running_loop().run_in_executor(None, read_ids)
+
+        assert seen == [("session-123", "user-456")]
+        assert asyncio.run(from_executor()) == ("session-123", "user-456")
+
+    def test_context_value_takes_precedence_over_process_default(self):
+        """Test a thread's own ID wins over one set later elsewhere."""
+        import threading
+
+        client = HeimdallClient(config=HeimdallConfig(enabled=False))
+        ready, proceed = threading.Event(), threading.Event()
+        seen = []
+
+        def handle():
+            client.set_user_id("thread-user")
+            ready.set()
+            proceed.wait()
+            seen.append(client.get_user_id())
+
+        thread = threading.Thread(target=handle)
+        thread.start()
+        ready.wait()
+        client.set_user_id("main-user")
+        proceed.set()
+        thread.join()
+
+        assert seen == ["thread-user"]
+        assert client.get_user_id() == "main-user"
+
+    def test_reset_client_ignores_previous_context_value(self):
+        """Test a new client does not inherit context values from a reset one."""
+        client = HeimdallClient(config=HeimdallConfig(enabled=False))
+        client.set_user_id("old-user")
+
+        HeimdallClient.reset()
+        client = HeimdallClient(config=HeimdallConfig(enabled=False))
+
+        assert client.get_user_id() is None
+
+    def test_context_does_not_keep_reset_client_alive(self):
+        """Test context values do not hold a reference to a discarded client."""
+        import gc
+        import weakref
+
+        client = HeimdallClient(config=HeimdallConfig(enabled=False))
+        client.set_session_id("session-123")
+        client_ref = weakref.ref(client)
+
+        HeimdallClient.reset()
+        del client
+        gc.collect()
 
-            # Clear user ID
-            client.set_user_id(None)
-            assert client.get_user_id() is None
+        assert client_ref() is None
 
     def test_session_id_from_environment_variable(self):
         """Test session ID initialization from environment variable."""
@@ -1,5 +1,6 @@
 """Tests for HeimdallConfig."""
 
+import dataclasses
 import os
 import pytest
 from unittest.mock import patch
@@ -49,24 +50,88 @@ class TestHeimdallConfig:
 
     def test_validate_invalid_batch_size(self):
         """Test validation fails for invalid batch size."""
-        config = HeimdallConfig(api_key="key", batch_size=0)
-        
         with pytest.raises(ValueError, match="batch_size must be at least 1"):
-            config.validate()
+            HeimdallConfig(api_key="key", enabled=True, batch_size=0)
 
     def test_validate_invalid_flush_interval(self):
         """Test validation fails for invalid flush interval."""
-        config = HeimdallConfig(api_key="key", flush_interval_ms=50)
-        
         with pytest.raises(ValueError, match="flush_interval_ms must be at least 100"):
-            config.validate()
+            HeimdallConfig(api_key="key", enabled=True, flush_interval_ms=50)
 
     def test_validate_invalid_queue_size(self):
         """Test validation fails when queue size is less than batch size."""
-        config = HeimdallConfig(api_key="key", batch_size=100, max_queue_size=50)
-        
         with pytest.raises(ValueError, match="max_queue_size must be at least batch_size"):
-            config.validate()
+            HeimdallConfig(api_key="key", enabled=True, batch_size=100, max_queue_size=50)
+
+    def test_validate_invalid_export_timeout(self):
+        """Test validation fails for a non-positive export timeout."""
+        with pytest.raises(ValueError, match="export_timeout_ms must be at least 1"):
+            HeimdallConfig(api_key="key", enabled=True, export_timeout_ms=0)
+
+    def test_export_defaults(self):
+        """Test export tuning defaults and environment overrides."""
+        config = HeimdallConfig()
+
+        assert config.batch_size == 256
+        assert config.max_queue_size == 4096
+        assert config.export_timeout_ms == 10000
+
+        with patch.dict(os.environ, {"HEIMDALL_EXPORT_TIMEOUT_MS": "2500"}):
+            assert HeimdallConfig().export_timeout_ms == 2500
+
+    def test_endpoint_default_depends_on_protocol(self, monkeypatch):
+        """Test the default endpoint uses the OTLP port of the configured transport."""
+        monkeypatch.delenv("HEIMDALL_ENDPOINT")
+
+        config = HeimdallConfig()
+        assert config.endpoint == ""
+        assert config.export_endpoint == "http://localhost:4318"
+        assert config.traces_endpoint == "http://localhost:4318/v1/traces"
+        assert HeimdallConfig(protocol="grpc").export_endpoint == "http://localhost:4317"
+
+        explicit = HeimdallConfig(protocol="grpc", endpoint="http://collector:4317")
+        assert explicit.export_endpoint == "http://collector:4317"
+
+    def test_replace_protocol_picks_matching_default_endpoint(self, monkeypatch):
+        """Test switching protocol with replace re-derives the default endpoint."""
+        monkeypatch.delenv("HEIMDALL_ENDPOINT")
+
+        grpc = dataclasses.replace(HeimdallConfig(), protocol="grpc")
+        assert grpc.export_endpoint == "http://localhost:4317"
+
+        http = dataclasses.replace(grpc, protocol="http/protobuf")
+        assert http.export_endpoint == "http://localhost:4318"
+        assert http.traces_endpoint == "http://localhost:4318/v1/traces"
+
+    def test_capture_defaults(self):
+        """Test input/output capture is on by default and configurable from env."""
+        config = HeimdallConfig()
+        assert config.capture_input is True
+        assert config.capture_output is True
+
+        with patch.dict(os.environ, {"HEIMDALL_CAPTURE_OUTPUT": "false"}):
+            assert HeimdallConfig().capture_output is False
+
+    def test_validate_invalid_sample_rate(self):
+        """Test validation fails for a sample rate outside [0, 1]."""
+        with pytest.raises(ValueError, match="sample_rate must be between 0.0 and 1.0"):
+            HeimdallConfig(api_key="key", enabled=True, sample_rate=1.5)
+
+    def test_validate_invalid_protocol(self):
+        """Test validation fails for an unsupported OTLP protocol."""
+        with pytest.raises(ValueError, match="protocol must be one of"):
+            HeimdallConfig(api_key="key", enabled=True, protocol="http/json")
+
+    def test_validate_negative_max_attribute_length(self):
+        """Test validation fails for a negative attribute length limit."""
+        with pytest.raises(ValueError, match="max_attribute_length must not be negative"):
+            HeimdallConfig(api_key="key", enabled=True, max_attribute_length=-1)
+
+    def test_invalid_env_value_fails_on_construction(self):
+        """Test invalid environment settings are rejected when the config is created."""
+        with patch.dict(os.environ, {"HEIMDALL_ENABLED": "true", "HEIMDALL_BATCH_SIZE": "0"}):
+            with pytest.raises(ValueError, match="batch_size must be at least 1"):
+                HeimdallConfig()
 
     def test_validate_success(self):
         """Test validation passes with valid config."""
@@ -87,6 +152,13 @@ class TestHeimdallConfig:
         # Should not raise even without API key
         config.validate()
 
+    def test_disabled_config_skips_range_validation(self):
+        """Test that export settings are not checked when tracing is disabled."""
+        config = HeimdallConfig(enabled=False, batch_size=0, sample_rate=2.0)
+
+        # Should not raise; a disabled client never uses these settings
+        config.validate()
+
     def test_metadata_default(self):
         """Test that metadata defaults to empty dict."""
         config = HeimdallConfig()
@@ -99,6 +171,42 @@ class TestHeimdallConfig:
 
         assert config.metadata == {"custom": "value"}
 
+    def test_config_is_frozen(self):
+        """Test that config fields and metadata cannot be mutated."""
+        config = HeimdallConfig(metadata={"custom": "value"})
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.service_name = "other"  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            config.metadata["custom"] = "other"  # type: ignore[index]
+
+    def test_config_is_hashable(self):
+        """Test configs can be hashed and used as dict keys."""
+        config = HeimdallConfig(metadata={"custom": "value"})
+        same = HeimdallConfig(metadata={"custom": "value"})
+
+        assert hash(config) == hash(same)
+        assert {config: "cached"}[same] == "cached"
+        assert config != dataclasses.replace(config, metadata={"custom": "other"})
+
+    def test_derived_export_settings(self):
+        """Test the traces endpoint and export headers derived from config."""
+        config = HeimdallConfig(api_key="key", enabled=True, endpoint="https://heimdall.dev/")
+
+        assert config.traces_endpoint == "https://heimdall.dev/v1/traces"
+        assert config.export_headers == {"authorization": "Bearer key"}
+
+        without_key = dataclasses.replace(config, api_key=None)
+        assert without_key.export_headers == {}
+
+    def test_replace_derives_modified_copy(self):
+        """Test dataclasses.replace creates an updated copy."""
+        config = HeimdallConfig(service_name="original")
+        updated = dataclasses.replace(config, service_name="updated")
+
+        assert config.service_name == "original"
+        assert updated.service_name == "updated"
+
 
 class TestSessionAndUserIdConfiguration:
     """Tests for session and user ID configuration."""
@@ -131,30 +239,16 @@ class TestSessionAndUserIdConfiguration:
 
             assert config.user_id == "explicit-user"
 
-    def test_session_id_none_when_not_set(self):
+    def test_session_id_none_when_not_set(self, monkeypatch):
         """Test session ID is None when not set."""
-        with patch.dict(os.environ, {}, clear=True):
-            # Need to also patch the conftest env vars
-            with patch.dict(os.environ, {
-                "HEIMDALL_API_KEY": "test-key",
-                "HEIMDALL_ENDPOINT": "https://test.heimdall.dev",
-                "HEIMDALL_SERVICE_NAME": "test-service",
-                "HEIMDALL_ENVIRONMENT": "test",
-            }):
-                config = HeimdallConfig()
-
-                assert config.session_id is None
-
-    def test_user_id_none_when_not_set(self):
+        monkeypatch.delenv("HEIMDALL_SESSION_ID", raising=False)
+        config = HeimdallConfig()
+
+        assert config.session_id is None
+
+    def test_user_id_none_when_not_set(self, monkeypatch):
         """Test user ID is None when not set."""
-        with patch.dict(os.environ, {}, clear=True):
-            # Need to also patch the conftest env vars
-            with patch.dict(os.environ, {
-                "HEIMDALL_API_KEY": "test-key",
-                "HEIMDALL_ENDPOINT": "https://test.heimdall.dev",
-                "HEIMDALL_SERVICE_NAME": "test-service",
-                "HEIMDALL_ENVIRONMENT": "test",
-            }):
-                config = HeimdallConfig()
-
-                assert config.user_id is None
+        monkeypatch.delenv("HEIMDALL_USER_ID", raising=False)
+        config = HeimdallConfig()
+
+        assert config.user_id is None
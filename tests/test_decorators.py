@@ -1,15 +1,30 @@
 """Tests for decorators."""
 
+import base64
+import dataclasses
+import enum
+import inspect
 import os
+import types
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 
 from hmdl.decorators import (
+    observe,
     trace_mcp_tool,
     _serialize_value,
     _capture_arguments,
+    _make_argument_binder,
+    _decode_jwt_claims,
+    _extract_from_headers,
+    _extract_ids,
+    _extract_user_id_from_token,
+    _parse_jwt_claims,
 )
 
+# {"sub": "user-123", "role": "admin"}
+TEST_JWT = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJzdWIiOiJ1c2VyLTEyMyIsInJvbGUiOiJhZG1pbiJ9.sig"
+
 
 class TestSerializeValue:
     """Tests for _serialize_value helper."""
@@ -17,18 +32,53 @@ class TestSerializeValue:
     def test_serialize_dict(self):
         """Test serializing a dictionary."""
         result = _serialize_value({"key": "value"})
-        assert result == '{"key": "value"}'
+        assert result == '{"key":"value"}'
 
     def test_serialize_list(self):
         """Test serializing a list."""
         result = _serialize_value([1, 2, 3])
-        assert result == "[1, 2, 3]"
+        assert result == "[1,2,3]"
+
+    def test_serialize_non_string_keys(self):
+        """Test dictionaries with non-string keys are serialized."""
+        result = _serialize_value({1: "one"})
+        assert result == '{"1":"one"}'
+
+    def test_serialize_truncates_long_values(self):
+        """Test values longer than max_length are truncated, marker included."""
+        result = _serialize_value("x" * 100, max_length=20)
+        assert result == '"xxxxx...[truncated]'
+        assert len(result) == 20
+        assert _serialize_value("x" * 10, max_length=0) == '"' + "x" * 10 + '"'
+
+    def test_serialize_at_limit_is_not_truncated(self):
+        """Test values exactly max_length long are kept whole."""
+        assert _serialize_value("x" * 18, max_length=20) == '"' + "x" * 18 + '"'
+
+    def test_serialize_truncates_below_marker_length(self):
+        """Test limits shorter than the marker cut without it."""
+        assert _serialize_value("x" * 10, max_length=5) == '"xxxx'
 
     def test_serialize_string(self):
         """Test serializing a string."""
         result = _serialize_value("hello")
         assert result == '"hello"'
 
+    def test_serialize_datetime_as_iso_format(self):
+        """Test datetimes are written as ISO 8601 with or without orjson."""
+        from datetime import datetime, timezone
+
+        result = _serialize_value({"at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)})
+        assert result == '{"at":"2024-01-02T03:04:05+00:00"}'
+
+    def test_serialize_scalars(self):
+        """Test None, booleans and integers serialize to their JSON form."""
+        assert _serialize_value(None) == "null"
+        assert _serialize_value(True) == "true"
+        assert _serialize_value(False) == "false"
+        assert _serialize_value(42) == "42"
+        assert _serialize_value(2**70) == str(2**70)
+
     def test_serialize_non_serializable(self):
         """Test serializing non-JSON-serializable object."""
         class Custom:
@@ -39,6 +89,67 @@ class TestSerializeValue:
         assert "custom-object" in result
 
 
+    def test_serialize_wide_integers_inside_containers(self):
+        """Test integers wider than 64 bits still produce JSON, not a repr."""
+        assert _serialize_value({"a": 2**70}) == '{"a":1180591620717411303424}'
+        assert _serialize_value([2**70]) == "[1180591620717411303424]"
+
+
+class TestStdlibJsonFallback:
+    """Tests for serialization and decoding without orjson installed."""
+
+    def test_serialize_compact_json(self, load_decorators):
+        """Test the stdlib encoder writes the same compact form as orjson."""
+        decorators = load_decorators(orjson=None)
+
+        result = decorators._serialize_value({"key": "välue", 1: [1, 2]})
+        assert result == '{"key":"välue","1":[1,2]}'
+        assert decorators._serialize_value({"a": 2**70}) == '{"a":1180591620717411303424}'
+
+    def test_serialize_dataclass_and_enum(self, load_decorators):
+        """Test dataclasses and Enums are encoded like orjson encodes them."""
+        decorators = load_decorators(orjson=None)
+
+        @dataclasses.dataclass
+        class Point:
+            x: int
+            y: int
+
+        class Color(enum.Enum):
+            RED = 1
+
+        assert decorators._serialize_value(Point(1, 2)) == '{"x":1,"y":2}'
+        assert decorators._serialize_value({"color": Color.RED}) == '{"color":1}'
+
+    def test_matches_default_encoder(self, load_decorators):
+        """Test span attributes are the same whichever encoder is installed."""
+        from datetime import date, datetime, timezone
+
+        decorators = load_decorators(orjson=None)
+
+        @dataclasses.dataclass
+        class Point:
+            x: int
+            y: int
+
+        class Color(enum.Enum):
+            RED = "red"
+
+        values = [
+            {"at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "on": date(2024, 1, 2)},
+            {"point": Point(1, 2), "color": Color.RED},
+            ["ünïcode", 1.5, None, True, 2**70],
+        ]
+        for value in values:
+            assert decorators._serialize_value(value) == _serialize_value(value)
+
+    def test_parse_jwt_claims(self, load_decorators):
+        """Test JWT claims decode with the stdlib JSON decoder."""
+        decorators = load_decorators(orjson=None)
+
+        assert decorators._parse_jwt_claims(TEST_JWT) == {"sub": "user-123", "role": "admin"}
+
+
 class TestCaptureArguments:
     """Tests for _capture_arguments helper."""
 
@@ -67,6 +178,134 @@ class TestCaptureArguments:
         assert result == {"a": 1, "b": 2, "c": 10}
 
 
+class TestMakeArgumentBinder:
+    """Tests for the precomputed argument binder."""
+
+    def test_binds_in_signature_order_with_defaults(self):
+        """Test arguments are bound in signature order with defaults applied."""
+        def func(a, b=2, *, c, d=4):
+            pass
+
+        bind = _make_argument_binder(func)
+        result = bind((1,), {"d": 5, "c": 3})
+
+        assert list(result.items()) == [("a", 1), ("b", 2), ("c", 3), ("d", 5)]
+
+    def test_matches_signature_binding(self):
+        """Test the fast binder agrees with inspect.Signature binding."""
+        def func(a, b, c=10):
+            pass
+
+        bind = _make_argument_binder(func)
+        for args, kwargs in [((1, 2, 3), {}), ((), {"a": 1, "b": 2}), ((1,), {"b": 2})]:
+            assert bind(args, kwargs) == _capture_arguments(func, args, kwargs)
+
+    def test_falls_back_for_variadic_signatures(self):
+        """Test *args/**kwargs signatures are bound via inspect."""
+        def func(a, *args, **kwargs):
+            pass
+
+        bind = _make_argument_binder(func)
+
+        assert bind((1, 2), {"x": 3}) == {"a": 1, "args": (2,), "kwargs": {"x": 3}}
+
+
+class TestParseJwtClaims:
+    """Tests for JWT claim parsing helpers."""
+
+    def test_parse_valid_jwt(self):
+        """Test parsing claims from a valid JWT."""
+        assert _parse_jwt_claims(TEST_JWT) == {"sub": "user-123", "role": "admin"}
+
+    def test_parse_jwt_with_bearer_prefix(self):
+        """Test parsing claims from a Bearer-prefixed token."""
+        assert _parse_jwt_claims(f"Bearer {TEST_JWT}")["sub"] == "user-123"
+        assert _parse_jwt_claims(f"bearer {TEST_JWT}")["sub"] == "user-123"
+        assert _parse_jwt_claims(f"BEARER {TEST_JWT}")["sub"] == "user-123"
+
+    def test_parse_invalid_jwt_returns_empty(self):
+        """Test invalid tokens return empty claims."""
+        assert _parse_jwt_claims("not-a-jwt") == {}
+        assert _parse_jwt_claims("only.two.parts.here.extra") == {}
+        assert _parse_jwt_claims("a.!!!.c") == {}
+
+    def test_repeated_parse_is_cached(self):
+        """Test the same token is only decoded once."""
+        _decode_jwt_claims.cache_clear()
+
+        _parse_jwt_claims(f"Bearer {TEST_JWT}")
+        _parse_jwt_claims(TEST_JWT)
+
+        info = _decode_jwt_claims.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_extract_user_id_from_token_or_claims(self):
+        """Test user ID extraction accepts a token or parsed claims."""
+        assert _extract_user_id_from_token(TEST_JWT) == "user-123"
+        assert _extract_user_id_from_token({"user_id": "user-456"}) == "user-456"
+        assert _extract_user_id_from_token({"sub": 123}) is None
+
+    def test_extract_from_headers(self):
+        """Test session and user IDs are extracted from headers."""
+        session_id, user_id = _extract_from_headers({
+            "Mcp-Session-Id": "session-123",
+            "Authorization": f"Bearer {TEST_JWT}",
+        })
+
+        assert session_id == "session-123"
+        assert user_id == "user-123"
+
+
+class TestBase64Decoders:
+    """Tests for decoding JWT payloads with and without pybase64."""
+
+    def test_decodes_with_pybase64(self, load_decorators):
+        """Test JWT payloads are decoded through pybase64 when it is installed."""
+        pybase64 = types.ModuleType("pybase64")
+        pybase64.urlsafe_b64decode = MagicMock(wraps=base64.urlsafe_b64decode)
+        decorators = load_decorators(pybase64=pybase64)
+
+        assert decorators._parse_jwt_claims(TEST_JWT) == {"sub": "user-123", "role": "admin"}
+        pybase64.urlsafe_b64decode.assert_called_once()
+
+    def test_decodes_without_pybase64(self, load_decorators):
+        """Test JWT payloads are decoded with binascii when pybase64 is missing."""
+        decorators = load_decorators(pybase64=None)
+
+        assert decorators._parse_jwt_claims(TEST_JWT) == {"sub": "user-123", "role": "admin"}
+
+
+class TestExtractIds:
+    """Tests for session and user ID extraction."""
+
+    def test_extractors_take_priority_over_headers(self):
+        """Test extractor results are preferred to header values."""
+        ids = _extract_ids(
+            (), {},
+            lambda args, kwargs: "extracted-session",
+            lambda args, kwargs: "extracted-user",
+            "header-session", "header-user",
+        )
+
+        assert ids == ("extracted-session", "extracted-user")
+
+    def test_falls_back_to_headers(self):
+        """Test empty or failing extractors fall back to header values."""
+        def failing(args, kwargs):
+            raise RuntimeError("boom")
+
+        ids = _extract_ids(
+            (), {},
+            lambda args, kwargs: None,
+            failing,
+            "header-session", "header-user",
+        )
+
+        assert ids == ("header-session", "header-user")
+        assert _extract_ids((), {}, None, None, None, None) == (None, None)
+
+
 class TestTraceMCPTool:
     """Tests for trace_mcp_tool decorator."""
 
@@ -89,6 +328,48 @@ class TestTraceMCPTool:
         result = asyncio.run(my_tool("test"))
         assert result == "result: test"
 
+    def test_partially_initialized_client_skips_tracing(self):
+        """Test a client published before __init__ finished is treated as disabled."""
+        from hmdl.client import HeimdallClient
+
+        HeimdallClient._instance = object.__new__(HeimdallClient)
+
+        @trace_mcp_tool()
+        def my_tool(query: str) -> str:
+            return f"result: {query}"
+
+        assert my_tool("test") == "result: test"
+
+    def test_disabled_client_skips_tracing(self):
+        """Test a disabled client calls through without starting a span."""
+        from hmdl.client import HeimdallClient
+
+        client = HeimdallClient()
+        assert client._tracer is None
+
+        @trace_mcp_tool()
+        def my_tool(query: str) -> str:
+            return f"result: {query}"
+
+        with patch("hmdl.client.trace.get_tracer") as mock_get_tracer:
+            assert my_tool("test") == "result: test"
+
+        mock_get_tracer.assert_not_called()
+
+    def test_async_detection_survives_stacking(self):
+        """Test wrappers of async functions are coroutine functions, even when stacked."""
+        @observe
+        @trace_mcp_tool()
+        async def my_tool() -> str:
+            return "ok"
+
+        @trace_mcp_tool()
+        def sync_tool() -> str:
+            return "ok"
+
+        assert inspect.iscoroutinefunction(my_tool)
+        assert not inspect.iscoroutinefunction(sync_tool)
+
     def test_custom_name(self):
         """Test decorator with custom name."""
         @trace_mcp_tool("custom-tool-name")
@@ -106,6 +387,20 @@ class TestTraceMCPTool:
 
         assert my_tool.__name__ == "my_tool"
 
+    def test_preserves_metadata_for_introspection(self):
+        """Test the docstring, annotations and signature survive decoration."""
+        def my_tool(query: str, limit: int = 10) -> list:
+            """Search for documents."""
+            return []
+
+        wrapped = trace_mcp_tool()(my_tool)
+
+        assert wrapped.__wrapped__ is my_tool
+        assert wrapped.__doc__ == "Search for documents."
+        assert wrapped.__module__ == my_tool.__module__
+        assert wrapped.__annotations__ == my_tool.__annotations__
+        assert inspect.signature(wrapped) == inspect.signature(my_tool)
+
     def test_exception_propagation(self):
         """Test exceptions are propagated."""
         @trace_mcp_tool()
@@ -144,6 +439,238 @@ class TestTraceMCPTool:
             asyncio.run(failing_async_tool())
 
 
+class TestSpanAttributes:
+    """Tests for the attributes recorded by traced functions."""
+
+    def test_records_arguments_and_result(self, enabled_client):
+        """Test arguments (with defaults) and the result are recorded."""
+        client, mock_tracer, mock_span = enabled_client
+
+        @trace_mcp_tool()
+        def search_tool(query: str, limit: int = 10) -> dict:
+            return {"count": limit}
+
+        assert search_tool("test") == {"count": 10}
+
+        attributes = mock_span.attributes
+        assert attributes["mcp.tool.name"] == "search_tool"
+        assert attributes["mcp.tool.arguments"] == '{"query":"test","limit":10}'
+        assert attributes["mcp.tool.result"] == '{"count":10}'
+        assert attributes["heimdall.status"] == "ok"
+        assert attributes["heimdall.user_id"] == "anonymous"
+        assert "heimdall.duration_ms" in attributes
+
+    def test_records_duration_in_milliseconds(self, enabled_client):
+        """Test the duration is measured with the nanosecond counter."""
+        client, mock_tracer, mock_span = enabled_client
+
+        @trace_mcp_tool()
+        def my_tool():
+            return None
+
+        with patch("hmdl.decorators.time.perf_counter_ns", side_effect=[1_000_000, 3_500_000]):
+            my_tool()
+
+        assert mock_span.attributes["heimdall.duration_ms"] == 2.5
+
+    def test_attributes_are_set_in_batches(self, enabled_client):
+        """Test a successful call writes input and output attributes in two batches."""
+        client, mock_tracer, mock_span = enabled_client
+
+        @trace_mcp_tool()
+        def my_tool(query: str) -> str:
+            return query
+
+        my_tool("test")
+
+        assert mock_span.calls == ["set_attributes", "set_attributes"]
+
+    def test_static_attributes_passed_at_span_start(self, enabled_client):
+        """Test the tool name and span kind are given to the tracer when the span starts."""
+        client, mock_tracer, mock_span = enabled_client
+
+        @trace_mcp_tool("my-tool")
+        def my_tool() -> None:
+            return None
+
+        my_tool()
+
+        _, _, kwargs = mock_tracer.started[0]
+        assert kwargs["attributes"] == {
+            "mcp.tool.name": "my-tool",
+            "heimdall.span_kind": "mcp.tool",
+        }
+
+    def test_capture_disabled_on_decorator(self, enabled_client):
+        """Test capture_input/capture_output=False skip arguments and result."""
+        client, mock_tracer, mock_span = enabled_client
+
+        @trace_mcp_tool(capture_input=False, capture_output=False)
+        def my_tool(query: str) -> str:
+            return query
+
+        assert my_tool("test") == "test"
+
+        attributes = mock_span.attributes
+        assert "mcp.tool.arguments" not in attributes
+        assert "mcp.tool.result" not in attributes
+        assert attributes["heimdall.status"] == "ok"
+
+    def test_capture_disabled_in_config(self, enabled_client):
+        """Test the client configuration can disable capture globally."""
+        client, mock_tracer, mock_span = enabled_client
+        client.config = dataclasses.replace(client.config, capture_input=False)
+
+        @trace_mcp_tool()
+        def my_tool(query: str) -> str:
+            return query
+
+        my_tool("test")
+
+        attributes = mock_span.attributes
+        assert "mcp.tool.arguments" not in attributes
+        assert attributes["mcp.tool.result"] == '"test"'
+
+    def test_records_error(self, enabled_client):
+        """Test exceptions are recorded on the span."""
+        client, mock_tracer, mock_span = enabled_client
+
+        @trace_mcp_tool()
+        def failing_tool():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            failing_tool()
+
+        attributes = mock_span.attributes
+        assert attributes["heimdall.status"] == "error"
+        assert attributes["heimdall.error.type"] == "ValueError"
+        assert attributes["heimdall.error.message"] == "boom"
+        assert len(mock_span.exceptions) == 1
+
+    def test_exception_recorded_once(self, enabled_client):
+        """Test the span context manager does not record the exception again."""
+        client, mock_tracer, mock_span = enabled_client
+
+        @trace_mcp_tool()
+        def failing_tool():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            failing_tool()
+
+        method, name, kwargs = mock_tracer.started[-1]
+        assert kwargs["record_exception"] is False
+        assert kwargs["set_status_on_exception"] is False
+        assert "set_attribute" not in mock_span.calls
+        assert "heimdall.duration_ms" in mock_span.attributes
+
+    def test_record_exceptions_disabled(self, enabled_client):
+        """Test exception events can be disabled while keeping error attributes."""
+        client, mock_tracer, mock_span = enabled_client
+        client.config = dataclasses.replace(client.config, record_exceptions=False)
+
+        @trace_mcp_tool()
+        def failing_tool():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            failing_tool()
+
+        assert mock_span.exceptions == []
+        assert mock_span.attributes["heimdall.error.type"] == "ValueError"
+
+    def test_records_async_arguments(self, enabled_client):
+        """Test async functions record their arguments."""
+        import asyncio
+
+        client, mock_tracer, mock_span = enabled_client
+
+        @trace_mcp_tool("async-tool")
+        async def my_tool(query: str) -> str:
+            return query
+
+        assert asyncio.run(my_tool(query="test")) == "test"
+
+        attributes = mock_span.attributes
+        assert attributes["mcp.tool.name"] == "async-tool"
+        assert attributes["mcp.tool.arguments"] == '{"query":"test"}'
+
+    def test_unsampled_span_skips_attributes(self, enabled_client):
+        """Test nothing is captured when the span is not recording."""
+        client, mock_tracer, mock_span = enabled_client
+        mock_span.recording = False
+
+        @trace_mcp_tool()
+        def my_tool(query: str) -> str:
+            return f"result: {query}"
+
+        assert my_tool("test") == "result: test"
+        assert mock_span.attributes == {}
+        assert mock_span.calls == []
+
+    def test_header_ids_recorded(self, enabled_client):
+        """Test session and user IDs from headers are recorded."""
+        client, mock_tracer, mock_span = enabled_client
+
+        @trace_mcp_tool(headers={"mcp-session-id": "session-1", "authorization": TEST_JWT})
+        def my_tool() -> str:
+            return "ok"
+
+        my_tool()
+
+        attributes = mock_span.attributes
+        assert attributes["heimdall.session_id"] == "session-1"
+        assert attributes["heimdall.user_id"] == "user-123"
+
+    def test_set_current_false_starts_detached_span(self, enabled_client):
+        """Test set_current=False starts a span without making it current."""
+        client, mock_tracer, mock_span = enabled_client
+
+        @trace_mcp_tool(set_current=False)
+        def my_tool() -> str:
+            return "ok"
+
+        assert my_tool() == "ok"
+
+        assert [started[0] for started in mock_tracer.started] == ["start_span"]
+        assert mock_span.ended
+        assert mock_span.attributes["heimdall.status"] == "ok"
+
+    def test_observe_records_input_and_output(self, enabled_client):
+        """Test observe shares the span recording of the MCP decorators."""
+        import asyncio
+
+        client, mock_tracer, mock_span = enabled_client
+
+        @observe
+        async def helper(value: int) -> int:
+            return value * 2
+
+        assert asyncio.run(helper(2)) == 4
+
+        attributes = mock_span.attributes
+        assert attributes["heimdall.span_kind"] == "internal"
+        assert attributes["heimdall.input"] == '{"value":2}'
+        assert attributes["heimdall.output"] == "4"
+        assert "heimdall.user_id" not in attributes
+
+    def test_observe_records_ok_status_and_duration(self, enabled_client):
+        """Test observe spans record status and duration even without output capture."""
+        client, mock_tracer, mock_span = enabled_client
+
+        @observe(capture_output=False)
+        def helper() -> str:
+            return "done"
+
+        assert helper() == "done"
+
+        attributes = mock_span.attributes
+        assert attributes["heimdall.status"] == "ok"
+        assert attributes["heimdall.duration_ms"] >= 0
+        assert "heimdall.output" not in attributes
+
+
 class TestSessionAndUserExtraction:
     """Tests for session and user extraction in decorators."""
 
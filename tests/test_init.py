@@ -0,0 +1,39 @@
+"""Tests for the hmdl package exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import hmdl
+
+
+class TestPackageExports:
+    """Tests for lazily imported package exports."""
+
+    def test_lazy_exports_resolve(self):
+        """Test lazily imported names resolve to the real objects."""
+        from hmdl.client import HeimdallClient
+        from hmdl.decorators import trace_mcp_tool
+
+        assert hmdl.HeimdallClient is HeimdallClient
+        assert hmdl.trace_mcp_tool is trace_mcp_tool
+
+    def test_all_names_available(self):
+        """Test every name in __all__ is available on the package."""
+        for name in hmdl.__all__:
+            assert hasattr(hmdl, name)
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            hmdl.does_not_exist
+
+    def test_import_does_not_load_sdk(self):
+        """Test importing hmdl does not import the OpenTelemetry SDK."""
+        code = "import sys, hmdl; print('opentelemetry.sdk' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "False"
@@ -0,0 +1,118 @@
+"""Tests for the MCP record types."""
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from hmdl.types import (
+    MCPPromptCall,
+    MCPResourceAccess,
+    MCPToolCall,
+    PromptMessage,
+    TraceContext,
+)
+
+
+class TestTimestamps:
+    """Tests for the timestamp_ns field and timestamp property."""
+
+    def test_timestamp_is_aware_utc_datetime(self):
+        """Test the timestamp property converts nanoseconds to an aware UTC datetime."""
+        call = MCPToolCall(name="tool", timestamp_ns=1_700_000_000_123_456_789)
+
+        assert call.timestamp == datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=timezone.utc)
+        assert call.timestamp.tzinfo is timezone.utc
+
+    def test_timestamp_keeps_sub_second_precision(self):
+        """Test microseconds survive the conversion, truncating finer digits."""
+        call = MCPResourceAccess(uri="file:///a", timestamp_ns=999_999_999)
+
+        assert call.timestamp == datetime(1970, 1, 1, 0, 0, 0, 999999, tzinfo=timezone.utc)
+
+    def test_timestamp_ns_defaults_to_creation_time(self):
+        """Test records are stamped with the current time when created."""
+        before = time.time_ns()
+        call = MCPPromptCall(name="prompt")
+        after = time.time_ns()
+
+        assert before <= call.timestamp_ns <= after
+
+    def test_timestamp_is_not_a_constructor_argument(self):
+        """Test the renamed field: timestamps are passed as timestamp_ns."""
+        with pytest.raises(TypeError):
+            MCPToolCall(name="tool", timestamp=datetime.now(timezone.utc))
+
+
+class TestPromptMessages:
+    """Tests for MCPPromptCall.messages."""
+
+    def test_messages_default_to_empty_tuple(self):
+        """Test a new prompt call has no messages."""
+        assert MCPPromptCall(name="prompt").messages == ()
+
+    def test_build_and_read_messages(self):
+        """Test messages are PromptMessage tuples read by field name."""
+        call = MCPPromptCall(
+            name="prompt",
+            messages=(PromptMessage(role="user", content="Hello"),),
+        )
+        call.messages += (PromptMessage("assistant", {"text": "Hi"}),)
+
+        assert [m.role for m in call.messages] == ["user", "assistant"]
+        assert call.messages[1].content == {"text": "Hi"}
+        assert call.messages[0] == ("user", "Hello")
+
+    def test_messages_cannot_be_appended_in_place(self):
+        """Test the tuple is immutable; callers build a new one instead."""
+        call = MCPPromptCall(name="prompt")
+
+        with pytest.raises(AttributeError):
+            call.messages.append(PromptMessage("user", "Hello"))  # type: ignore[attr-defined]
+
+
+class TestTraceContextTags:
+    """Tests for TraceContext.tags."""
+
+    def test_tags_default_to_empty_frozenset(self):
+        """Test a new context has an empty, immutable tag set."""
+        context = TraceContext(trace_id="t", span_id="s")
+
+        assert context.tags == frozenset()
+        assert isinstance(context.tags, frozenset)
+
+    def test_tags_support_membership_and_union(self):
+        """Test tags are added by building a new set with ``|``."""
+        context = TraceContext(trace_id="t", span_id="s", tags=frozenset({"a"}))
+        context.tags = context.tags | {"b", "a"}
+
+        assert "a" in context.tags
+        assert context.tags == frozenset({"a", "b"})
+
+    def test_tags_cannot_be_mutated_in_place(self):
+        """Test the frozenset has no add(); callers build a new set instead."""
+        context = TraceContext(trace_id="t", span_id="s")
+
+        with pytest.raises(AttributeError):
+            context.tags.add("a")  # type: ignore[attr-defined]
+
+
+class TestOptionalDefaults:
+    """Tests for mapping fields that default to None instead of {}."""
+
+    def test_arguments_default_to_none(self):
+        """Test tool and prompt calls without arguments store None."""
+        assert MCPToolCall(name="tool").arguments is None
+        assert MCPPromptCall(name="prompt").arguments is None
+
+    def test_metadata_defaults_to_none(self):
+        """Test a trace context without metadata stores None."""
+        assert TraceContext(trace_id="t", span_id="s").metadata is None
+
+    def test_explicit_mappings_are_kept(self):
+        """Test passed mappings are stored as given."""
+        arguments = {"query": "x"}
+
+        assert MCPToolCall(name="tool", arguments=arguments).arguments is arguments
+        assert MCPPromptCall(name="prompt", arguments={}).arguments == {}
+        assert TraceContext(trace_id="t", span_id="s", metadata={"k": 1}).metadata == {"k": 1}